@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 
 import structlog
 
@@ -14,7 +15,7 @@ from sharp_seeker.engine.pipeline import DetectionPipeline
 log = structlog.get_logger()
 
 
-@dataclass
+@dataclass(frozen=True)
 class BacktestResult:
     start: str
     end: str
@@ -24,8 +25,9 @@ class BacktestResult:
     signals_by_sport: dict[str, int] = field(default_factory=dict)
     all_signals: list[Signal] = field(default_factory=list)
 
-    @property
+    @cached_property
     def summary(self) -> str:
+        """Human-readable report, formatted once — the result is frozen."""
         lines = [
             f"Backtest: {self.start} → {self.end}",
             f"  Fetch cycles: {self.fetch_cycles}",
@@ -50,22 +52,31 @@ class Backtester:
 
     async def run(self, start: str, end: str) -> BacktestResult:
         """Replay all stored snapshots in the date range through detectors."""
-        fetch_times = await self._repo.get_distinct_fetch_times(start, end)
-        log.info("backtest_start", start=start, end=end, cycles=len(fetch_times))
+        # Every cycle's event IDs come back from one query
+        cycles = await self._repo.get_cycle_event_ids(start, end)
+        log.info("backtest_start", start=start, end=end, cycles=len(cycles))
 
-        result = BacktestResult(start=start, end=end, fetch_cycles=len(fetch_times))
-
-        for fetched_at in fetch_times:
-            signals = await self._pipeline.run(fetched_at)
-            result.total_signals += len(signals)
+        signals_by_type: dict[str, int] = {}
+        signals_by_sport: dict[str, int] = {}
+        all_signals: list[Signal] = []
 
+        for fetched_at, event_ids in cycles:
+            signals = await self._pipeline.run(fetched_at, event_ids)
             for sig in signals:
                 st = sig.signal_type.value
-                result.signals_by_type[st] = result.signals_by_type.get(st, 0) + 1
-                result.signals_by_sport[sig.sport_key] = (
-                    result.signals_by_sport.get(sig.sport_key, 0) + 1
-                )
-                result.all_signals.append(sig)
+                signals_by_type[st] = signals_by_type.get(st, 0) + 1
+                signals_by_sport[sig.sport_key] = signals_by_sport.get(sig.sport_key, 0) + 1
+            all_signals.extend(signals)
+
+        result = BacktestResult(
+            start=start,
+            end=end,
+            fetch_cycles=len(cycles),
+            total_signals=len(all_signals),
+            signals_by_type=signals_by_type,
+            signals_by_sport=signals_by_sport,
+            all_signals=all_signals,
+        )
 
         log.info(
             "backtest_complete",
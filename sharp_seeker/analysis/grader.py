@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from collections.abc import AsyncIterator
 
+import aiosqlite
 import structlog
 
 from sharp_seeker.api.odds_client import OddsClient
@@ -12,6 +15,17 @@ from sharp_seeker.db.repository import Repository
 
 log = structlog.get_logger()
 
+# Concurrent /scores requests in flight during one grading run
+MAX_CONCURRENT_SCORE_FETCHES = 8
+
+
+async def _prepend(
+    first: aiosqlite.Row, rest: AsyncIterator[aiosqlite.Row]
+) -> AsyncIterator[aiosqlite.Row]:
+    yield first
+    async for row in rest:
+        yield row
+
 
 class ScoreGrader:
     def __init__(
@@ -21,49 +35,71 @@ class ScoreGrader:
         self._odds_client = odds_client
         self._repo = repo
 
+    async def _reference_line(
+        self,
+        memo: dict[tuple[str, str, str, str], float | None],
+        event_id: str,
+        market_key: str,
+        outcome_name: str,
+        signal_at: str,
+    ) -> float | None:
+        """get_reference_line, memoized for one grading run."""
+        key = (event_id, market_key, outcome_name, signal_at)
+        if key not in memo:
+            memo[key] = await self._repo.get_reference_line(
+                event_id, market_key, outcome_name, signal_at
+            )
+        return memo[key]
+
     async def resolve_all(self) -> dict[str, int]:
         """Grade all unresolved signals against final scores.
 
         Returns counts: {"resolved": N, "skipped": N, "errors": N}
         """
-        unresolved = await self._repo.get_unresolved_signals()
-        if not unresolved:
+        # Signals are streamed rather than loaded up front; peek at the first
+        # so an empty backlog costs no score fetches
+        unresolved = self._repo.iter_unresolved_signals()
+        first = await anext(unresolved, None)
+        if first is None:
             log.info("grader_no_unresolved")
             return {"resolved": 0, "skipped": 0, "errors": 0}
 
         # Collect sport keys from unresolved signals to fetch scores
-        sport_keys: set[str] = set()
-        for sig in unresolved:
-            teams = await self._repo.get_event_teams(sig["event_id"])
-            if teams:
-                # Get sport_key from snapshots
-                row = await self._repo._db.execute(
-                    "SELECT sport_key FROM odds_snapshots WHERE event_id = ? LIMIT 1",
-                    (sig["event_id"],),
-                )
-                sport_row = await row.fetchone()
-                if sport_row:
-                    sport_keys.add(sport_row["sport_key"])
+        sport_keys = await self._repo.get_unresolved_sport_keys()
 
         if not sport_keys:
             # Fall back to configured sports
             sport_keys = set(self._settings.sports)
 
-        # Fetch scores for each sport (with daysFrom=3 to catch weekend games)
+        # Fetch scores for every sport concurrently (with daysFrom=3 to catch
+        # weekend games). Each fetch handles its own errors so one failing
+        # sport doesn't cancel the rest of the task group.
         scores_by_event: dict[str, dict] = {}
-        for sport_key in sport_keys:
-            try:
-                games = await self._odds_client.fetch_scores(sport_key, days_from=3)
-                for game in games:
-                    scores_by_event[game["id"]] = game
-            except Exception:
-                log.exception("grader_fetch_scores_error", sport=sport_key)
+        limit = asyncio.Semaphore(MAX_CONCURRENT_SCORE_FETCHES)
+
+        async def fetch(sport_key: str) -> None:
+            async with limit:
+                try:
+                    games = await self._odds_client.fetch_scores(sport_key, days_from=3)
+                except Exception:
+                    log.exception("grader_fetch_scores_error", sport=sport_key)
+                    return
+            for game in games:
+                scores_by_event[game["id"]] = game
+
+        async with asyncio.TaskGroup() as tg:
+            for sport_key in sport_keys:
+                tg.create_task(fetch(sport_key))
 
         resolved = 0
         skipped = 0
         errors = 0
+        # Signal types firing on the same side at the same time share a line
+        reference_lines: dict[tuple[str, str, str, str], float | None] = {}
+        # Results are written in one batch once every signal is graded
+        graded: list[dict[str, str]] = []
 
-        for sig in unresolved:
+        async for sig in _prepend(first, unresolved):
             sig_dict = dict(sig)
             event_id = sig_dict["event_id"]
             market_key = sig_dict["market_key"]
@@ -82,8 +118,8 @@ class ScoreGrader:
                 elif market_key == "spreads":
                     point = self._extract_bet_point(sig_dict)
                     if point is None:
-                        point = await self._repo.get_reference_line(
-                            event_id, market_key, outcome_name, signal_at
+                        point = await self._reference_line(
+                            reference_lines, event_id, market_key, outcome_name, signal_at
                         )
                     if point is None:
                         log.warning(
@@ -97,8 +133,8 @@ class ScoreGrader:
                 elif market_key == "totals":
                     point = self._extract_bet_point(sig_dict)
                     if point is None:
-                        point = await self._repo.get_reference_line(
-                            event_id, market_key, outcome_name, signal_at
+                        point = await self._reference_line(
+                            reference_lines, event_id, market_key, outcome_name, signal_at
                         )
                     if point is None:
                         log.warning(
@@ -114,18 +150,14 @@ class ScoreGrader:
                     skipped += 1
                     continue
 
-                await self._repo.resolve_signal(
-                    event_id, signal_type, market_key, outcome_name, signal_at, result
-                )
-                resolved += 1
-                log.info(
-                    "signal_resolved",
-                    event_id=event_id,
-                    signal_type=signal_type,
-                    market=market_key,
-                    outcome=outcome_name,
-                    result=result,
-                )
+                graded.append({
+                    "event_id": event_id,
+                    "signal_type": signal_type,
+                    "market_key": market_key,
+                    "outcome_name": outcome_name,
+                    "signal_at": signal_at,
+                    "result": result,
+                })
             except Exception:
                 log.exception(
                     "grader_error",
@@ -134,6 +166,23 @@ class ScoreGrader:
                 )
                 errors += 1
 
+        try:
+            await self._repo.resolve_signals(graded)
+        except Exception:
+            log.exception("grader_write_error", count=len(graded))
+            errors += len(graded)
+        else:
+            resolved = len(graded)
+            for row in graded:
+                log.info(
+                    "signal_resolved",
+                    event_id=row["event_id"],
+                    signal_type=row["signal_type"],
+                    market=row["market_key"],
+                    outcome=row["outcome_name"],
+                    result=row["result"],
+                )
+
         log.info(
             "grader_complete",
             resolved=resolved,
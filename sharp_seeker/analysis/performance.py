@@ -35,22 +35,25 @@ class PerformanceTracker:
         )
 
     async def record_signals(self, signals: list[Signal], fetched_at: str) -> None:
-        """Record multiple signals with a shared fetched_at timestamp."""
-        for sig in signals:
-            direction = self._extract_direction(sig)
-            is_live = self._compute_is_live(fetched_at, sig.commence_time)
-            await self._repo.record_signal_result(
-                event_id=sig.event_id,
-                signal_type=sig.signal_type.value,
-                market_key=sig.market_key,
-                outcome_name=sig.outcome_name,
-                signal_direction=direction,
-                signal_strength=sig.strength,
-                signal_at=fetched_at,
-                details_json=json.dumps(sig.details),
-                sport_key=sig.sport_key,
-                is_live=is_live,
-            )
+        """Record multiple signals with a shared fetched_at timestamp.
+
+        All rows go to the DB in one executemany + commit.
+        """
+        await self._repo.record_signal_results([
+            {
+                "event_id": sig.event_id,
+                "signal_type": sig.signal_type.value,
+                "market_key": sig.market_key,
+                "outcome_name": sig.outcome_name,
+                "signal_direction": self._extract_direction(sig),
+                "signal_strength": sig.strength,
+                "signal_at": fetched_at,
+                "details_json": json.dumps(sig.details),
+                "sport_key": sig.sport_key,
+                "is_live": self._compute_is_live(fetched_at, sig.commence_time),
+            }
+            for sig in signals
+        ])
 
     async def get_stats(self, since: str | None = None) -> dict[str, dict[str, int]]:
         """Get win/loss/push stats grouped by signal type."""
@@ -11,6 +11,7 @@ import structlog
 
 from sharp_seeker.api.schemas import EventOddsSchema, SportSchema
 from sharp_seeker.config import Settings
+from sharp_seeker.db.models import Snapshot
 from sharp_seeker.db.repository import Repository
 from sharp_seeker.polling.smart import filter_events_for_cycle
 
@@ -71,7 +72,7 @@ class OddsClient:
         now = fetched_at or datetime.now(timezone.utc).isoformat()
 
         # Flatten into snapshot rows
-        rows = []
+        rows: list[Snapshot] = []
         for event in events:
             for bm in event.bookmakers:
                 for market in bm.markets:
@@ -80,20 +81,20 @@ class OddsClient:
                             outcome.link or market.link or bm.link
                         )
                         rows.append(
-                            {
-                                "event_id": event.id,
-                                "sport_key": event.sport_key,
-                                "home_team": event.home_team,
-                                "away_team": event.away_team,
-                                "commence_time": event.commence_time,
-                                "bookmaker_key": bm.key,
-                                "market_key": market.key,
-                                "outcome_name": outcome.name,
-                                "price": outcome.price,
-                                "point": outcome.point,
-                                "deep_link": deep_link,
-                                "fetched_at": now,
-                            }
+                            Snapshot(
+                                event_id=event.id,
+                                sport_key=event.sport_key,
+                                home_team=event.home_team,
+                                away_team=event.away_team,
+                                commence_time=event.commence_time,
+                                bookmaker_key=bm.key,
+                                market_key=market.key,
+                                outcome_name=outcome.name,
+                                price=outcome.price,
+                                point=outcome.point,
+                                deep_link=deep_link,
+                                fetched_at=now,
+                            )
                         )
 
         inserted = await self._repo.insert_snapshots(rows)
@@ -9,23 +9,30 @@ from sharp_seeker.db.models import SCHEMA_SQL
 
 log = structlog.get_logger()
 
+# sqlite3's per-connection prepared-statement cache (default 128). The repository
+# issues a fixed set of SQL strings, so a roomier cache keeps every hot query
+# compiled once for the life of the connection.
+STATEMENT_CACHE_SIZE = 256
+
 
 async def _run_migrations(db: aiosqlite.Connection) -> None:
     """Apply incremental schema migrations for existing databases."""
     migrations = [
         "ALTER TABLE sent_alerts ADD COLUMN is_free_play INTEGER DEFAULT 0",
+        # Superseded by idx_snapshots_fetched_event (fetched_at, event_id)
+        "DROP INDEX IF EXISTS idx_snapshots_fetched",
     ]
     for sql in migrations:
         try:
             await db.execute(sql)
         except Exception:
-            pass  # Column already exists
+            pass  # Already applied (e.g. column already exists)
     await db.commit()
 
 
 async def init_db(db_path: str) -> aiosqlite.Connection:
     """Create tables if they don't exist and return a connection."""
-    db = await aiosqlite.connect(db_path)
+    db = await aiosqlite.connect(db_path, cached_statements=STATEMENT_CACHE_SIZE)
     db.row_factory = aiosqlite.Row
     await db.execute("PRAGMA journal_mode=WAL")
     await db.executescript(SCHEMA_SQL)
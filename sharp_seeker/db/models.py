@@ -1,5 +1,27 @@
 """SQL schema definitions for Sharp Seeker."""
 
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class Snapshot(NamedTuple):
+    """One odds_snapshots row to insert, fields in column order."""
+
+    event_id: str
+    sport_key: str
+    home_team: str
+    away_team: str
+    commence_time: str
+    bookmaker_key: str
+    market_key: str
+    outcome_name: str
+    price: float
+    point: float | None
+    deep_link: str | None
+    fetched_at: str
+
+
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS odds_snapshots (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -40,8 +62,9 @@ CREATE TABLE IF NOT EXISTS api_usage (
 CREATE INDEX IF NOT EXISTS idx_snapshots_event_fetched
     ON odds_snapshots(event_id, fetched_at);
 
-CREATE INDEX IF NOT EXISTS idx_snapshots_fetched
-    ON odds_snapshots(fetched_at);
+-- Covers "which events are in this fetch" lookups without touching the table
+CREATE INDEX IF NOT EXISTS idx_snapshots_fetched_event
+    ON odds_snapshots(fetched_at, event_id);
 
 CREATE INDEX IF NOT EXISTS idx_alerts_dedup
     ON sent_alerts(event_id, alert_type, market_key, outcome_name, sent_at);
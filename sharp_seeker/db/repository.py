@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import json
+import sqlite3
+import sys
+from collections.abc import AsyncIterator, Mapping, Sequence
 from datetime import datetime, timezone
+from itertools import groupby
+from operator import itemgetter
 from typing import Any
 
 import aiosqlite
 import structlog
 
+from sharp_seeker.db.models import Snapshot
+
 log = structlog.get_logger()
 
 # "Sent to Discord" = a sent_alerts row exists for this play. This is the ground
@@ -24,25 +32,56 @@ _SENT_ALERTS_EXISTS = (
 )
 
 
+# Snapshot columns that detectors use as dict/tuple keys. Interning them means
+# every row shares one str object per distinct value, so key hashing hits the
+# cached hash and equality short-circuits on identity.
+_INTERNED_COLUMNS = frozenset({"bookmaker_key", "market_key", "outcome_name"})
+
+
+def _interning_row_factory(cursor: sqlite3.Cursor, row: tuple) -> sqlite3.Row:
+    """Row factory for snapshot reads: sqlite3.Row with key columns interned."""
+    names = cursor.description
+    return sqlite3.Row(
+        cursor,
+        tuple(
+            sys.intern(v) if v.__class__ is str and names[i][0] in _INTERNED_COLUMNS else v
+            for i, v in enumerate(row)
+        ),
+    )
+
+
 class Repository:
     def __init__(self, db: aiosqlite.Connection) -> None:
         self._db = db
 
     # ── Odds snapshots ──────────────────────────────────────────────
 
-    async def insert_snapshots(self, rows: list[dict[str, Any]]) -> int:
-        """Bulk-insert snapshot rows, ignoring duplicates. Returns count inserted."""
+    async def _fetch_snapshots(self, sql: str, params: tuple) -> list[aiosqlite.Row]:
+        """Run a snapshot read, interning the key columns (see _INTERNED_COLUMNS)."""
+        cursor = await self._db.execute(sql, params)
+        cursor.row_factory = _interning_row_factory
+        return await cursor.fetchall()
+
+    async def insert_snapshots(self, rows: Sequence[Snapshot | Mapping[str, Any]]) -> int:
+        """Bulk-insert snapshot rows, ignoring duplicates. Returns count inserted.
+
+        Rows are Snapshot tuples (what ingestion builds) or mappings with the
+        same keys; both are bound positionally.
+        """
         if not rows:
             return 0
         sql = """
             INSERT OR IGNORE INTO odds_snapshots
                 (event_id, sport_key, home_team, away_team, commence_time,
                  bookmaker_key, market_key, outcome_name, price, point, deep_link, fetched_at)
-            VALUES
-                (:event_id, :sport_key, :home_team, :away_team, :commence_time,
-                 :bookmaker_key, :market_key, :outcome_name, :price, :point, :deep_link, :fetched_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
-        cursor = await self._db.executemany(sql, rows)
+        fields = Snapshot._fields
+        params = [
+            row if isinstance(row, tuple) else tuple(row[f] for f in fields)
+            for row in rows
+        ]
+        cursor = await self._db.executemany(sql, params)
         await self._db.commit()
         inserted = cursor.rowcount  # type: ignore[union-attr]
         log.debug("snapshots_inserted", count=inserted, total=len(rows))
@@ -57,8 +96,51 @@ class Repository:
             WHERE event_id = ? AND fetched_at >= ?
             ORDER BY fetched_at ASC
         """
-        cursor = await self._db.execute(sql, (event_id, since))
-        return await cursor.fetchall()
+        return await self._fetch_snapshots(sql, (event_id, since))
+
+    async def get_window_endpoints(
+        self, event_id: str, since: str
+    ) -> list[aiosqlite.Row]:
+        """Get the first and last snapshot per bookmaker/market/outcome since a timestamp.
+
+        One row per combo with first_price/first_point, last_price/last_point,
+        last_deep_link and n (snapshots in the window), plus the event metadata
+        columns. is_latest is 1 when the combo's last row belongs to the event's
+        most recent fetch, so those last_* columns are what get_latest_snapshots
+        would return for it. The reduction runs in SQLite so callers get
+        O(combos) rows instead of every snapshot in the window. Rows come back
+        in first-seen order, matching a Python group-by over get_snapshots_since.
+        """
+        sql = """
+            SELECT event_id, sport_key, home_team, away_team, commence_time,
+                   bookmaker_key, market_key, outcome_name,
+                   first_price, first_point, last_price, last_point, last_deep_link,
+                   n, last_at = latest_at AS is_latest
+            FROM (
+                SELECT *,
+                       FIRST_VALUE(price) OVER w AS first_price,
+                       FIRST_VALUE(point) OVER w AS first_point,
+                       LAST_VALUE(price) OVER w AS last_price,
+                       LAST_VALUE(point) OVER w AS last_point,
+                       LAST_VALUE(deep_link) OVER w AS last_deep_link,
+                       LAST_VALUE(fetched_at) OVER w AS last_at,
+                       MAX(fetched_at) OVER () AS latest_at,
+                       FIRST_VALUE(fetched_at) OVER w AS first_at,
+                       FIRST_VALUE(id) OVER w AS first_id,
+                       COUNT(*) OVER w AS n,
+                       ROW_NUMBER() OVER w AS rn
+                FROM odds_snapshots
+                WHERE event_id = ? AND fetched_at >= ?
+                WINDOW w AS (
+                    PARTITION BY bookmaker_key, market_key, outcome_name
+                    ORDER BY fetched_at
+                    ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+                )
+            )
+            WHERE rn = 1
+            ORDER BY first_at ASC, first_id ASC
+        """
+        return await self._fetch_snapshots(sql, (event_id, since))
 
     async def get_latest_snapshots(self, event_id: str) -> list[aiosqlite.Row]:
         """Get the most recent snapshot for each bookmaker/market/outcome combo."""
@@ -68,8 +150,7 @@ class Repository:
                 SELECT MAX(fetched_at) FROM odds_snapshots WHERE event_id = ?
             )
         """
-        cursor = await self._db.execute(sql, (event_id, event_id))
-        return await cursor.fetchall()
+        return await self._fetch_snapshots(sql, (event_id, event_id))
 
     async def get_previous_snapshots(
         self, event_id: str, before: str
@@ -88,8 +169,36 @@ class Repository:
                 AND s.outcome_name = prev.outcome_name
                 AND s.fetched_at = prev.prev_at
         """
-        cursor = await self._db.execute(sql, (event_id, before, event_id))
-        return await cursor.fetchall()
+        return await self._fetch_snapshots(sql, (event_id, before, event_id))
+
+    async def get_previous_snapshots_at(
+        self, fetched_at: str
+    ) -> dict[str, list[aiosqlite.Row]]:
+        """get_previous_snapshots for every event in one fetch, keyed by event ID.
+
+        One query for the whole cycle instead of one per event; events with no
+        earlier snapshot are absent from the result.
+        """
+        sql = """
+            SELECT s.* FROM odds_snapshots s
+            INNER JOIN (
+                SELECT event_id, bookmaker_key, market_key, outcome_name,
+                       MAX(fetched_at) AS prev_at
+                FROM odds_snapshots
+                WHERE event_id IN (
+                    SELECT DISTINCT event_id FROM odds_snapshots WHERE fetched_at = ?
+                ) AND fetched_at < ?
+                GROUP BY event_id, bookmaker_key, market_key, outcome_name
+            ) prev ON s.event_id = prev.event_id
+                AND s.bookmaker_key = prev.bookmaker_key
+                AND s.market_key = prev.market_key
+                AND s.outcome_name = prev.outcome_name
+                AND s.fetched_at = prev.prev_at
+        """
+        by_event: dict[str, list[aiosqlite.Row]] = {}
+        for row in await self._fetch_snapshots(sql, (fetched_at, fetched_at)):
+            by_event.setdefault(row["event_id"], []).append(row)
+        return by_event
 
     async def get_distinct_event_ids_at(self, fetched_at: str) -> list[str]:
         """Get all distinct event IDs from a specific fetch timestamp."""
@@ -100,6 +209,46 @@ class Repository:
 
     # ── Sent alerts (dedup) ─────────────────────────────────────────
 
+    async def get_pinnacle_moved_event_ids(self, fetched_at: str) -> set[str]:
+        """Get event IDs at this fetch whose current Pinnacle line differs from its previous one.
+
+        Mirrors the latest/previous pairing used by ``get_latest_snapshots`` and
+        ``get_previous_snapshots`` so detectors that only compare those two can be
+        skipped for events outside the returned set.
+        """
+        sql = """
+            WITH events AS (
+                SELECT DISTINCT event_id FROM odds_snapshots WHERE fetched_at = ?
+            ),
+            latest_at AS (
+                SELECT event_id, MAX(fetched_at) AS at FROM odds_snapshots
+                WHERE event_id IN (SELECT event_id FROM events)
+                GROUP BY event_id
+            ),
+            prev_at AS (
+                SELECT event_id, market_key, outcome_name, MAX(fetched_at) AS at
+                FROM odds_snapshots
+                WHERE event_id IN (SELECT event_id FROM events)
+                  AND bookmaker_key = 'pinnacle' AND fetched_at < ?
+                GROUP BY event_id, market_key, outcome_name
+            )
+            SELECT DISTINCT cur.event_id FROM odds_snapshots cur
+            JOIN latest_at l ON cur.event_id = l.event_id AND cur.fetched_at = l.at
+            JOIN prev_at p ON p.event_id = cur.event_id
+                AND p.market_key = cur.market_key
+                AND p.outcome_name = cur.outcome_name
+            JOIN odds_snapshots prev ON prev.event_id = p.event_id
+                AND prev.bookmaker_key = 'pinnacle'
+                AND prev.market_key = p.market_key
+                AND prev.outcome_name = p.outcome_name
+                AND prev.fetched_at = p.at
+            WHERE cur.bookmaker_key = 'pinnacle'
+              AND (cur.price != prev.price OR cur.point IS NOT prev.point)
+        """
+        cursor = await self._db.execute(sql, (fetched_at, fetched_at))
+        rows = await cursor.fetchall()
+        return {row["event_id"] for row in rows}
+
     async def was_alert_sent_recently(
         self,
         event_id: str,
@@ -132,6 +281,29 @@ class Repository:
         cursor = await self._db.execute(sql, params)
         return (await cursor.fetchone()) is not None
 
+    async def get_recently_alerted(
+        self, event_ids: list[str], cooldown_minutes: int
+    ) -> set[tuple[str, str, str]]:
+        """Get (event_id, alert_type, market_key) keys alerted within the cooldown window.
+
+        Batch form of was_alert_sent_recently (market level) for a whole cycle.
+        """
+        if not event_ids:
+            return set()
+        cutoff = datetime.now(timezone.utc).isoformat()
+        # IDs go in as one JSON array so the SQL text is the same every cycle
+        # and the statement stays in the connection's prepared-statement cache
+        sql = """
+            SELECT DISTINCT event_id, alert_type, market_key FROM sent_alerts
+            WHERE event_id IN (SELECT value FROM json_each(?))
+              AND sent_at >= datetime(?, '-' || ? || ' minutes')
+        """
+        cursor = await self._db.execute(
+            sql, (json.dumps(event_ids), cutoff, cooldown_minutes)
+        )
+        rows = await cursor.fetchall()
+        return {(row["event_id"], row["alert_type"], row["market_key"]) for row in rows}
+
     async def record_alert(
         self,
         event_id: str,
@@ -267,6 +439,26 @@ class Repository:
         rows = await cursor.fetchall()
         return [row["fetched_at"] for row in rows]
 
+    async def get_cycle_event_ids(
+        self, start: str, end: str
+    ) -> list[tuple[str, list[str]]]:
+        """get_distinct_fetch_times paired with each cycle's event IDs, in one query.
+
+        Returns [(fetched_at, [event_id, ...]), ...] in fetched_at order; each
+        cycle's IDs match get_distinct_event_ids_at for that timestamp.
+        """
+        sql = """
+            SELECT DISTINCT fetched_at, event_id FROM odds_snapshots
+            WHERE fetched_at >= ? AND fetched_at <= ?
+            ORDER BY fetched_at ASC, event_id ASC
+        """
+        cursor = await self._db.execute(sql, (start, end))
+        rows = await cursor.fetchall()
+        return [
+            (fetched_at, [row["event_id"] for row in group])
+            for fetched_at, group in groupby(rows, key=itemgetter("fetched_at"))
+        ]
+
     # ── Signal results (performance tracking) ──────────────────────
 
     async def record_signal_result(
@@ -299,6 +491,29 @@ class Repository:
         )
         await self._db.commit()
 
+    async def record_signal_results(self, rows: list[dict[str, Any]]) -> int:
+        """Bulk-insert signal_results rows, ignoring duplicates. Returns count inserted.
+
+        Each row carries the same fields as record_signal_result's arguments.
+        """
+        if not rows:
+            return 0
+        sql = """
+            INSERT OR IGNORE INTO signal_results
+                (event_id, sport_key, signal_type, market_key, outcome_name,
+                 signal_direction, signal_strength, signal_at, is_live, details_json)
+            VALUES
+                (:event_id, :sport_key, :signal_type, :market_key, :outcome_name,
+                 :signal_direction, :signal_strength, :signal_at, :is_live, :details_json)
+        """
+        params = [
+            {**row, "is_live": None if row.get("is_live") is None else int(row["is_live"])}
+            for row in rows
+        ]
+        cursor = await self._db.executemany(sql, params)
+        await self._db.commit()
+        return cursor.rowcount  # type: ignore[union-attr]
+
     async def resolve_signal(
         self, event_id: str, signal_type: str, market_key: str,
         outcome_name: str, signal_at: str, result: str,
@@ -316,12 +531,51 @@ class Repository:
         )
         await self._db.commit()
 
+    async def resolve_signals(self, rows: list[dict[str, Any]]) -> None:
+        """Bulk resolve_signal: mark many signals won/lost/push in one commit.
+
+        Each row carries event_id, signal_type, market_key, outcome_name,
+        signal_at and result.
+        """
+        if not rows:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        sql = """
+            UPDATE signal_results
+            SET result = :result, resolved_at = :resolved_at
+            WHERE event_id = :event_id AND signal_type = :signal_type
+              AND market_key = :market_key AND outcome_name = :outcome_name
+              AND signal_at = :signal_at
+        """
+        await self._db.executemany(sql, [{**row, "resolved_at": now} for row in rows])
+        await self._db.commit()
+
     async def get_unresolved_signals(self) -> list[aiosqlite.Row]:
         """Get signals that haven't been resolved yet."""
         sql = "SELECT * FROM signal_results WHERE result IS NULL"
         cursor = await self._db.execute(sql)
         return await cursor.fetchall()
 
+    async def iter_unresolved_signals(self) -> AsyncIterator[aiosqlite.Row]:
+        """get_unresolved_signals as a stream, yielded as the cursor reads rows."""
+        sql = "SELECT * FROM signal_results WHERE result IS NULL"
+        async with self._db.execute(sql) as cursor:
+            async for row in cursor:
+                yield row
+
+    async def get_unresolved_sport_keys(self) -> set[str]:
+        """Sport keys of unresolved signals' events, taken from their snapshots."""
+        sql = """
+            SELECT DISTINCT (
+                SELECT sport_key FROM odds_snapshots s
+                WHERE s.event_id = r.event_id LIMIT 1
+            ) AS sport_key
+            FROM signal_results r
+            WHERE r.result IS NULL
+        """
+        cursor = await self._db.execute(sql)
+        return {row["sport_key"] for row in await cursor.fetchall() if row["sport_key"]}
+
     async def get_performance_stats(
         self, since: str | None = None, sport_key: str | None = None,
         exclude_sports: list[str] | None = None,
@@ -473,30 +727,14 @@ class Repository:
     ) -> float | None:
         """Get the spread/total point closest to signal time.
 
-        Prefers Pinnacle, falls back to any bookmaker.
+        Prefers Pinnacle, falls back to any bookmaker — one query, with
+        Pinnacle rows ordered ahead of everything else.
         """
-        # Try Pinnacle first
-        sql = """
-            SELECT point FROM odds_snapshots
-            WHERE event_id = ? AND market_key = ? AND outcome_name = ?
-              AND fetched_at <= ? AND point IS NOT NULL
-              AND bookmaker_key = 'pinnacle'
-            ORDER BY fetched_at DESC
-            LIMIT 1
-        """
-        cursor = await self._db.execute(
-            sql, (event_id, market_key, outcome_name, signal_at)
-        )
-        row = await cursor.fetchone()
-        if row:
-            return row["point"]
-
-        # Fall back to any bookmaker
         sql = """
             SELECT point FROM odds_snapshots
             WHERE event_id = ? AND market_key = ? AND outcome_name = ?
               AND fetched_at <= ? AND point IS NOT NULL
-            ORDER BY fetched_at DESC
+            ORDER BY bookmaker_key = 'pinnacle' DESC, fetched_at DESC
             LIMIT 1
         """
         cursor = await self._db.execute(
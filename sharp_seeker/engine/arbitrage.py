@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import aiosqlite
 import structlog
 
 from sharp_seeker.config import Settings
 from sharp_seeker.db.repository import Repository
-from sharp_seeker.engine.base import BaseDetector, Signal, SignalType
+from sharp_seeker.engine.base import BaseDetector, RequestCache, Signal, SignalType
 from sharp_seeker.engine.hold import (
     _implied_prob,
     collect_market_prices_by_market,
@@ -21,18 +22,21 @@ class ArbitrageDetector(BaseDetector):
         self._settings = settings
         self._repo = repo
 
-    async def detect(self, event_id: str, fetched_at: str) -> list[Signal]:
-        latest = await self._repo.get_latest_snapshots(event_id)
+    async def detect(
+        self, event_id: str, fetched_at: str, cache: RequestCache | None = None
+    ) -> list[Signal]:
+        cache = cache or RequestCache()
+        latest = await cache.latest(self._repo, event_id)
         if not latest:
             return []
 
         # Index by (market, outcome) -> {bookmaker: row}
-        by_market: dict[tuple[str, str], dict[str, dict]] = {}
+        # Rows are read in place — nothing below mutates them, so no dict copies
+        by_market: dict[tuple[str, str], dict[str, aiosqlite.Row]] = {}
         meta: tuple[str, str, str, str] | None = None
 
         excluded = set(self._settings.arb_excluded_books)
-        for _row in latest:
-            row = dict(_row)
+        for row in latest:
             if row["bookmaker_key"] in excluded:
                 continue
             key = (row["market_key"], row["outcome_name"])
@@ -119,15 +123,15 @@ class ArbitrageDetector(BaseDetector):
                     "outcome": outcome_a,
                     "bookmaker": best_a[0],
                     "price": best_a[1]["price"],
-                    "point": best_a[1].get("point"),
-                    "deep_link": best_a[1].get("deep_link"),
+                    "point": best_a[1]["point"],
+                    "deep_link": best_a[1]["deep_link"],
                 },
                 "side_b": {
                     "outcome": other,
                     "bookmaker": best_b[0],
                     "price": best_b[1]["price"],
-                    "point": best_b[1].get("point"),
-                    "deep_link": best_b[1].get("deep_link"),
+                    "point": best_b[1]["point"],
+                    "deep_link": best_b[1]["deep_link"],
                 },
             },
         )
@@ -151,9 +155,9 @@ class ArbitrageDetector(BaseDetector):
         books_b = by_market.get((market_key, other), {})
 
         # Group side A books by point value
-        points_a: dict[float, list[tuple[str, dict]]] = {}
+        points_a: dict[float, list[tuple[str, aiosqlite.Row]]] = {}
         for bm, row in books_a.items():
-            pt = row.get("point")
+            pt = row["point"]
             if pt is not None:
                 points_a.setdefault(pt, []).append((bm, row))
 
@@ -170,7 +174,7 @@ class ArbitrageDetector(BaseDetector):
 
             b_entries = [
                 (bm, row) for bm, row in books_b.items()
-                if row.get("point") == pt_b
+                if row["point"] == pt_b
             ]
             if not b_entries:
                 continue
@@ -206,15 +210,15 @@ class ArbitrageDetector(BaseDetector):
                         "outcome": outcome_a,
                         "bookmaker": best_a[0],
                         "price": best_a[1]["price"],
-                        "point": best_a[1].get("point"),
-                        "deep_link": best_a[1].get("deep_link"),
+                        "point": best_a[1]["point"],
+                        "deep_link": best_a[1]["deep_link"],
                     },
                     "side_b": {
                         "outcome": other,
                         "bookmaker": best_b[0],
                         "price": best_b[1]["price"],
-                        "point": best_b[1].get("point"),
-                        "deep_link": best_b[1].get("deep_link"),
+                        "point": best_b[1]["point"],
+                        "deep_link": best_b[1]["deep_link"],
                     },
                 },
             )
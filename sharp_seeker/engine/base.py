@@ -3,8 +3,18 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import aiosqlite
+
+    from sharp_seeker.db.repository import Repository
 
 
 class SignalType(str, Enum):
@@ -16,7 +26,7 @@ class SignalType(str, Enum):
     ARBITRAGE = "arbitrage"
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     signal_type: SignalType
     event_id: str
@@ -31,10 +41,102 @@ class Signal:
     details: dict = field(default_factory=dict)
 
 
+@lru_cache(maxsize=256)
+def window_start_iso(fetched_at: str, minutes: int) -> str:
+    """ISO timestamp ``minutes`` before ``fetched_at``.
+
+    Every event in a cycle shares one fetched_at, and the windowed detectors
+    share a window length, so this parses once per cycle instead of once per
+    event per detector.
+    """
+    return (datetime.fromisoformat(fetched_at) - timedelta(minutes=minutes)).isoformat()
+
+
+class RequestCache:
+    """Per-run memo of snapshot reads shared by every detector.
+
+    Most detectors start from the same "latest" (and "previous") snapshot set,
+    or the same window first/last reduction, for an event; the pipeline hands
+    one cache to all of them so each query runs once per event instead of once
+    per detector. Entries are the in-flight query futures, so detectors running
+    concurrently that miss on the same key still share one query. Rows are
+    immutable aiosqlite.Row objects, so sharing them is safe; derived indexes
+    (latest_by_side) are shared too and must be treated as read-only. Lives only for a
+    single pipeline run — no invalidation needed.
+    """
+
+    def __init__(self) -> None:
+        self._futures: dict[tuple, asyncio.Future[Any]] = {}
+
+    def _memo(self, key: tuple, query: Callable[[], Awaitable[Any]]) -> asyncio.Future[Any]:
+        fut = self._futures.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(query())
+            self._futures[key] = fut
+        return fut
+
+    def prime_previous(
+        self, event_id: str, before: str, rows: list[aiosqlite.Row]
+    ) -> None:
+        """Seed previous() with rows the caller already fetched in bulk."""
+        fut = asyncio.get_running_loop().create_future()
+        fut.set_result(rows)
+        self._futures[("previous", event_id, before)] = fut
+
+    async def latest(self, repo: Repository, event_id: str) -> list[aiosqlite.Row]:
+        return await self._memo(
+            ("latest", event_id), lambda: repo.get_latest_snapshots(event_id)
+        )
+
+    async def latest_by_side(
+        self, repo: Repository, event_id: str
+    ) -> dict[tuple[str, str], dict[str, aiosqlite.Row]]:
+        """latest() indexed as (market, outcome) → {bookmaker: row}.
+
+        Pinnacle divergence and the exchange monitor both look lines up by
+        side; the index is built in one pass and shared between them.
+        """
+
+        async def build() -> dict[tuple[str, str], dict[str, aiosqlite.Row]]:
+            by_side: dict[tuple[str, str], dict[str, aiosqlite.Row]] = {}
+            for row in await self.latest(repo, event_id):
+                key = (row["market_key"], row["outcome_name"])
+                by_side.setdefault(key, {})[row["bookmaker_key"]] = row
+            return by_side
+
+        return await self._memo(("latest_by_side", event_id), build)
+
+    async def previous(
+        self, repo: Repository, event_id: str, before: str
+    ) -> list[aiosqlite.Row]:
+        return await self._memo(
+            ("previous", event_id, before),
+            lambda: repo.get_previous_snapshots(event_id, before),
+        )
+
+    async def window_endpoints(
+        self, repo: Repository, event_id: str, since: str
+    ) -> list[aiosqlite.Row]:
+        return await self._memo(
+            ("endpoints", event_id, since),
+            lambda: repo.get_window_endpoints(event_id, since),
+        )
+
+
 class BaseDetector(abc.ABC):
     """Abstract base class for all detection strategies."""
 
+    # True for detectors that can only signal when Pinnacle's line moved between
+    # the previous and latest snapshot; the pipeline skips them for quiet events.
+    requires_pinnacle_move: bool = False
+
     @abc.abstractmethod
-    async def detect(self, event_id: str, fetched_at: str) -> list[Signal]:
-        """Analyze snapshots for an event and return any detected signals."""
+    async def detect(
+        self, event_id: str, fetched_at: str, cache: RequestCache | None = None
+    ) -> list[Signal]:
+        """Analyze snapshots for an event and return any detected signals.
+
+        ``cache`` shares snapshot reads with the other detectors in the same
+        pipeline run; when omitted a private one is used.
+        """
         ...
@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+import aiosqlite
 import structlog
 
 from sharp_seeker.config import Settings
 from sharp_seeker.db.repository import Repository
-from sharp_seeker.engine.base import BaseDetector, Signal, SignalType
+from sharp_seeker.engine.base import BaseDetector, RequestCache, Signal, SignalType
 
 log = structlog.get_logger()
 
 BETFAIR_KEY = "betfair_ex_eu"
-US_BOOKS = {"draftkings", "fanduel", "betmgm", "williamhill_us", "betrivers", "fanatics", "hardrockbet", "espnbet"}
+US_BOOKS = frozenset({"draftkings", "fanduel", "betmgm", "williamhill_us", "betrivers", "fanatics", "hardrockbet", "espnbet"})
 
 
+@lru_cache(maxsize=4096)
 def american_to_implied_prob(price: float) -> float:
-    """Convert American odds to implied probability (0–1)."""
+    """Convert American odds to implied probability (0–1).
+
+    Memoized: quoted prices come from a small discrete set and every detector
+    converts the same ones each cycle.
+    """
     if price > 0:
         return 100.0 / (price + 100.0)
     else:
@@ -27,47 +35,41 @@ class ExchangeMonitorDetector(BaseDetector):
         self._settings = settings
         self._repo = repo
 
-    async def detect(self, event_id: str, fetched_at: str) -> list[Signal]:
-        latest = await self._repo.get_latest_snapshots(event_id)
-        previous = await self._repo.get_previous_snapshots(event_id, fetched_at)
+    async def detect(
+        self, event_id: str, fetched_at: str, cache: RequestCache | None = None
+    ) -> list[Signal]:
+        cache = cache or RequestCache()
+        latest = await cache.latest(self._repo, event_id)
+        previous = await cache.previous(self._repo, event_id, fetched_at)
 
         if not latest or not previous:
             return []
 
-        # Index previous Betfair rows by (market, outcome)
-        prev_map: dict[tuple[str, str], dict] = {}
-        for _row in previous:
-            row = dict(_row)
+        # Index previous Betfair rows by (market, outcome). Rows are read in
+        # place — nothing below mutates them, so no per-row dict copies.
+        prev_map: dict[tuple[str, str], aiosqlite.Row] = {}
+        for row in previous:
             if row["bookmaker_key"] == BETFAIR_KEY:
                 prev_map[(row["market_key"], row["outcome_name"])] = row
 
         if not prev_map:
             return []
 
-        # Index current US book lines by (market, outcome, bookmaker)
-        us_current: dict[tuple[str, str, str], dict] = {}
-        meta: tuple[str, str, str, str] | None = None
-
-        for _row in latest:
-            row = dict(_row)
-            if meta is None:
-                meta = (row["sport_key"], row["home_team"], row["away_team"], row["commence_time"])
-            if row["bookmaker_key"] in US_BOOKS:
-                us_current[(row["market_key"], row["outcome_name"], row["bookmaker_key"])] = row
+        # Lines by (market, outcome) → {bookmaker: row}, shared with Pinnacle
+        # divergence; Betfair h2h rows are the only ones that can signal
+        # (exchange data only reliable for h2h)
+        by_side = await cache.latest_by_side(self._repo, event_id)
+        exchange_rows = [
+            books[BETFAIR_KEY]
+            for (mk, _), books in by_side.items()
+            if mk == "h2h" and BETFAIR_KEY in books
+        ]
+        head = latest[0]
+        meta = (head["sport_key"], head["home_team"], head["away_team"], head["commence_time"])
 
         signals: list[Signal] = []
 
-        for _row in latest:
-            row = dict(_row)
-            if row["bookmaker_key"] != BETFAIR_KEY:
-                continue
-            # Exchange data only reliable for h2h
-            if row["market_key"] != "h2h":
-                continue
-
-            if meta is None:
-                meta = (row["sport_key"], row["home_team"], row["away_team"], row["commence_time"])
-
+        for row in exchange_rows:
             key = (row["market_key"], row["outcome_name"])
             prev = prev_map.get(key)
             if prev is None:
@@ -88,8 +90,8 @@ class ExchangeMonitorDetector(BaseDetector):
             # implied prob are offering value (higher payout)
             new_exchange_price = row["price"]
             value_books: list[dict] = []
-            for (mk, on, bm_key), us_row in us_current.items():
-                if mk != row["market_key"] or on != row["outcome_name"]:
+            for bm_key, us_row in by_side[key].items():
+                if bm_key not in US_BOOKS:
                     continue
                 us_prob = american_to_implied_prob(us_row["price"])
                 # If exchange shortened (more likely) but US book still has
@@ -100,17 +102,17 @@ class ExchangeMonitorDetector(BaseDetector):
                     value_books.append({
                         "bookmaker": bm_key,
                         "price": us_row["price"],
-                        "point": us_row.get("point"),
+                        "point": us_row["point"],
                         "implied_prob": round(us_prob, 4),
-                        "deep_link": us_row.get("deep_link"),
+                        "deep_link": us_row["deep_link"],
                     })
                 elif direction == "drifted" and us_prob > new_prob:
                     value_books.append({
                         "bookmaker": bm_key,
                         "price": us_row["price"],
-                        "point": us_row.get("point"),
+                        "point": us_row["point"],
                         "implied_prob": round(us_prob, 4),
-                        "deep_link": us_row.get("deep_link"),
+                        "deep_link": us_row["deep_link"],
                     })
 
             signals.append(
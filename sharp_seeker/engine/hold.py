@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 # Hold boost thresholds — based on PD hold analysis (2026-03-16).
 # Lower hold correlates with higher win rate: totals 64% at <4.5% vs 57%
 # at 4.5-5.5%; NHL 61% vs 57%.
@@ -11,8 +13,9 @@ HOLD_SHARP_BOOST = 0.08        # strength boost for sharp hold
 HOLD_AVERAGE_BOOST = 0.04      # strength boost for below-average hold
 
 
+@lru_cache(maxsize=4096)
 def _implied_prob(price: float) -> float:
-    """Convert American odds to implied probability."""
+    """Convert American odds to implied probability (memoized per price)."""
     if price >= 100:
         return 100.0 / (price + 100.0)
     return abs(price) / (abs(price) + 100.0)
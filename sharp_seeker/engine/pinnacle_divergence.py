@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from datetime import datetime, timedelta
-
 import structlog
 
 from sharp_seeker.config import Settings
 from sharp_seeker.db.repository import Repository
-from sharp_seeker.engine.base import BaseDetector, Signal, SignalType
+from sharp_seeker.engine.base import (
+    BaseDetector,
+    RequestCache,
+    Signal,
+    SignalType,
+    window_start_iso,
+)
 from sharp_seeker.engine.exchange_monitor import american_to_implied_prob
 from sharp_seeker.engine.hold import (
     collect_market_prices_by_market,
@@ -19,7 +22,7 @@ from sharp_seeker.engine.hold import (
 log = structlog.get_logger()
 
 PINNACLE_KEY = "pinnacle"
-US_BOOKS = {"draftkings", "fanduel", "betmgm", "williamhill_us", "betrivers", "fanatics", "hardrockbet", "espnbet"}
+US_BOOKS = frozenset({"draftkings", "fanduel", "betmgm", "williamhill_us", "betrivers", "fanatics", "hardrockbet", "espnbet"})
 
 
 def _compute_hold(
@@ -88,7 +91,7 @@ class PinnacleDivergenceDetector(BaseDetector):
         self._repo = repo
 
     async def _pinnacle_recent_direction(
-        self, event_id: str, fetched_at: str
+        self, event_id: str, fetched_at: str, cache: RequestCache
     ) -> dict[tuple[str, str], dict]:
         """How has Pinnacle's line moved over the recent window, per side?
 
@@ -103,48 +106,46 @@ class PinnacleDivergenceDetector(BaseDetector):
         spreads. direction ∈ {"toward", "against", "flat", "unknown"}.
         """
         try:
-            window_start = (
-                datetime.fromisoformat(fetched_at)
-                - timedelta(minutes=self._settings.steam_window_minutes)
-            ).isoformat()
+            window_start = window_start_iso(fetched_at, self._settings.steam_window_minutes)
         except (ValueError, TypeError):
             return {}
 
-        snaps = await self._repo.get_snapshots_since(event_id, window_start)
-        series: dict[tuple[str, str], list[tuple[str, float, float | None]]] = defaultdict(list)
-        for _snap in snaps:
-            row = dict(_snap)
+        # Same window as steam/RLM, so the first/last reduction is shared.
+        endpoints = await cache.window_endpoints(self._repo, event_id, window_start)
+        series: dict[tuple[str, str], tuple] = {}  # key → (first, last, count)
+        for row in endpoints:
             if row["bookmaker_key"] != PINNACLE_KEY:
                 continue
-            if row["market_key"] not in ("h2h", "spreads"):
+            market_key = row["market_key"]
+            if market_key not in ("h2h", "spreads"):
                 continue
-            series[(row["market_key"], row["outcome_name"])].append(
-                (row["fetched_at"], row["price"], row["point"])
+            series[(market_key, row["outcome_name"])] = (
+                (row["first_price"], row["first_point"]),
+                (row["last_price"], row["last_point"]),
+                row["n"],
             )
 
         out: dict[tuple[str, str], dict] = {}
-        for (market_key, outcome_name), entries in series.items():
-            if len(entries) < 2:
+        for (market_key, outcome_name), (first, last, count) in series.items():
+            if count < 2:
                 out[(market_key, outcome_name)] = {"direction": "unknown", "delta": 0.0}
                 continue
-            entries.sort(key=lambda e: e[0])
-            first, last = entries[0], entries[-1]
             if market_key == "h2h":
                 # Implied-prob change: up = side became more likely = shortened.
                 delta = (
-                    american_to_implied_prob(last[1])
-                    - american_to_implied_prob(first[1])
+                    american_to_implied_prob(last[0])
+                    - american_to_implied_prob(first[0])
                 )
                 if abs(delta) < 0.005:
                     direction = "flat"
                 else:
                     direction = "toward" if delta > 0 else "against"
             else:  # spreads
-                if first[2] is None or last[2] is None:
+                if first[1] is None or last[1] is None:
                     out[(market_key, outcome_name)] = {"direction": "unknown", "delta": 0.0}
                     continue
                 # Lower point = side more favored by the sharp market = backed.
-                delta = last[2] - first[2]
+                delta = last[1] - first[1]
                 if delta == 0:
                     direction = "flat"
                 else:
@@ -155,23 +156,22 @@ class PinnacleDivergenceDetector(BaseDetector):
             }
         return out
 
-    async def detect(self, event_id: str, fetched_at: str) -> list[Signal]:
-        latest = await self._repo.get_latest_snapshots(event_id)
+    async def detect(
+        self, event_id: str, fetched_at: str, cache: RequestCache | None = None
+    ) -> list[Signal]:
+        cache = cache or RequestCache()
+        latest = await cache.latest(self._repo, event_id)
         if not latest:
             return []
 
-        # Index by (market, outcome) → {bookmaker: row}
-        by_market: dict[tuple[str, str], dict[str, dict]] = {}
-        meta: tuple[str, str, str, str] | None = None
-
-        for _row in latest:
-            row = dict(_row)
-            key = (row["market_key"], row["outcome_name"])
-            by_market.setdefault(key, {})[row["bookmaker_key"]] = row
-            if meta is None:
-                meta = (row["sport_key"], row["home_team"], row["away_team"], row["commence_time"])
+        # (market, outcome) → {bookmaker: row}, shared with the exchange monitor
+        by_market = await cache.latest_by_side(self._repo, event_id)
+        head = latest[0]
+        meta = (head["sport_key"], head["home_team"], head["away_team"], head["commence_time"])
 
-        if meta is None:
+        # Every signal compares against Pinnacle; without its line (common early
+        # in a slate) skip the direction lookup and the per-side work entirely
+        if not any(PINNACLE_KEY in books for books in by_market.values()):
             return []
 
         signals: list[Signal] = []
@@ -179,41 +179,53 @@ class PinnacleDivergenceDetector(BaseDetector):
         excluded = set(self._settings.pd_excluded_books) | set(sport_excluded)
 
         # Sharp-line movement annotation (measurement only — see method docstring)
-        pin_direction = await self._pinnacle_recent_direction(event_id, fetched_at)
+        pin_direction = await self._pinnacle_recent_direction(event_id, fetched_at, cache)
+
+        # Per-sport thresholds are fixed for the event — resolve them once
+        ml_threshold = self._settings.pd_sport_ml_prob_overrides.get(
+            meta[0], self._settings.pinnacle_ml_prob_threshold
+        )
+        totals_threshold = self._settings.pd_sport_totals_overrides.get(
+            meta[0], self._settings.pinnacle_totals_threshold
+        )
+        spread_threshold = self._settings.pd_sport_spread_overrides.get(
+            meta[0], self._settings.pinnacle_spread_threshold
+        )
 
         for (market_key, outcome_name), books in by_market.items():
             pinnacle = books.get(PINNACLE_KEY)
             if pinnacle is None:
                 continue
 
+            # Pinnacle's side of the comparison is shared by every US book here
+            if market_key == "h2h":
+                pin_val = pinnacle["price"]
+                pin_prob = american_to_implied_prob(pin_val)
+                threshold = ml_threshold
+            else:
+                pin_val = pinnacle["point"]
+                if pin_val is None:
+                    continue
+                threshold = totals_threshold if market_key == "totals" else spread_threshold
+
+            # Pinnacle/cross-book hold and US dispersion describe the side, not
+            # the US book — computed once, when the first book clears the
+            # delta checks, instead of once per qualifying book
+            side_metrics: tuple[float | None, float | None, float, int] | None = None
+
             for bm_key, row in books.items():
                 if bm_key not in US_BOOKS or bm_key in excluded:
                     continue
 
                 if market_key == "h2h":
                     us_val = row["price"]
-                    pin_val = pinnacle["price"]
                     us_prob = american_to_implied_prob(us_val)
-                    pin_prob = american_to_implied_prob(pin_val)
                     delta = abs(us_prob - pin_prob)
-                    threshold = self._settings.pd_sport_ml_prob_overrides.get(
-                        meta[0], self._settings.pinnacle_ml_prob_threshold
-                    )
                 else:
-                    if row["point"] is not None and pinnacle["point"] is not None:
-                        us_val = row["point"]
-                        pin_val = pinnacle["point"]
-                        delta = abs(us_val - pin_val)
-                        if market_key == "totals":
-                            threshold = self._settings.pd_sport_totals_overrides.get(
-                                meta[0], self._settings.pinnacle_totals_threshold
-                            )
-                        else:
-                            threshold = self._settings.pd_sport_spread_overrides.get(
-                                meta[0], self._settings.pinnacle_spread_threshold
-                            )
-                    else:
+                    us_val = row["point"]
+                    if us_val is None:
                         continue
+                    delta = abs(us_val - pin_val)
 
                 if delta < threshold:
                     continue
@@ -229,15 +241,35 @@ class PinnacleDivergenceDetector(BaseDetector):
 
                 strength = min(1.0, delta / (threshold * 3))
 
+                if side_metrics is None:
+                    pin_hold = _compute_hold(by_market, market_key, outcome_name, PINNACLE_KEY)
+
+                    # Cross-book hold: synthetic hold from best prices across all books
+                    cb_prices_a, cb_prices_b, _ = collect_market_prices_by_market(
+                        by_market, market_key, outcome_name,
+                    )
+                    cross_hold = compute_cross_book_hold(cb_prices_a, cb_prices_b)
+
+                    # Price dispersion: how spread out are US books on this side?
+                    # High dispersion = value book is a real outlier = better signal.
+                    # Low dispersion = books agree = less reliable.
+                    if market_key == "h2h":
+                        us_values = [
+                            american_to_implied_prob(b["price"])
+                            for bk, b in books.items()
+                            if bk in US_BOOKS and bk not in excluded
+                        ]
+                    else:
+                        us_values = [
+                            b["point"] for bk, b in books.items()
+                            if bk in US_BOOKS and bk not in excluded and b["point"] is not None
+                        ]
+                    dispersion = (max(us_values) - min(us_values)) if len(us_values) >= 2 else 0.0
+                    side_metrics = (pin_hold, cross_hold, dispersion, len(us_values))
+                pin_hold, cross_hold, dispersion, n_us = side_metrics
+
                 # Hold metrics: kept for analytics/display, NOT used in strength
                 us_hold = _compute_hold(by_market, market_key, outcome_name, bm_key)
-                pin_hold = _compute_hold(by_market, market_key, outcome_name, PINNACLE_KEY)
-
-                # Cross-book hold: synthetic hold from best prices across all books
-                cb_prices_a, cb_prices_b, _ = collect_market_prices_by_market(
-                    by_market, market_key, outcome_name,
-                )
-                cross_hold = compute_cross_book_hold(cb_prices_a, cb_prices_b)
 
                 # Suppress tight hold — market has converged, no real edge.
                 # NBA: block 0-1% only (experiment starting 2026-04-20); we have
@@ -288,26 +320,7 @@ class PinnacleDivergenceDetector(BaseDetector):
                 ):
                     continue
 
-                # Price dispersion: how spread out are US books on this side?
-                # High dispersion = value book is a real outlier = better signal.
-                # Low dispersion = books agree = less reliable.
-                same_side_books = by_market.get((market_key, outcome_name), {})
-                if market_key == "h2h":
-                    us_probs = [
-                        american_to_implied_prob(b["price"])
-                        for bk, b in same_side_books.items()
-                        if bk in US_BOOKS and bk not in excluded
-                    ]
-                    dispersion = (max(us_probs) - min(us_probs)) if len(us_probs) >= 2 else 0.0
-                else:
-                    us_points = [
-                        b["point"] for bk, b in same_side_books.items()
-                        if bk in US_BOOKS and bk not in excluded and b.get("point") is not None
-                    ]
-                    dispersion = (max(us_points) - min(us_points)) if len(us_points) >= 2 else 0.0
-
                 # Skip signals where all US books agree (no real outlier)
-                n_us = len(us_probs if market_key == "h2h" else us_points)
                 if dispersion == 0 and n_us >= 2:
                     continue
 
@@ -324,8 +337,8 @@ class PinnacleDivergenceDetector(BaseDetector):
                     "value_books": [{
                         "bookmaker": bm_key,
                         "price": row["price"],
-                        "point": row.get("point"),
-                        "deep_link": row.get("deep_link"),
+                        "point": row["point"],
+                        "deep_link": row["deep_link"],
                     }],
                 }
                 if market_key == "h2h":
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import asyncio
+import logging
+from collections import Counter, defaultdict
+from collections.abc import Callable
 from datetime import datetime, timezone
 
 import structlog
 
 from sharp_seeker.config import Settings
 from sharp_seeker.db.repository import Repository
-from sharp_seeker.engine.base import BaseDetector, Signal, SignalType
+from sharp_seeker.engine.base import BaseDetector, RequestCache, Signal, SignalType
 from sharp_seeker.engine.arbitrage import ArbitrageDetector
 from sharp_seeker.engine.exchange_monitor import ExchangeMonitorDetector
 from sharp_seeker.engine.pinnacle_divergence import PinnacleDivergenceDetector
@@ -71,67 +74,102 @@ def _merge_same_side_value_books(best: Signal, sigs: list[Signal]) -> None:
         )
 
 
-def _pick_best_signal(sigs: list[Signal]) -> Signal:
-    """From mirror-side signals, pick the most actionable one.
+def _pick_reverse(sigs: list[Signal], market: str) -> Signal | None:
+    """Reverse Line: follow Pinnacle — keep the side where Pinnacle moved favorably."""
+    for s in sigs:
+        if s.details.get("pinnacle_delta", 0) > 0:
+            return s
+    return None
 
-    Each signal type has a preferred side based on its directional context:
-    - Reverse Line: follow Pinnacle's direction (pinnacle_delta > 0)
-    - Steam Move: stale books are value on the side where the line moved
-      AGAINST bettors (direction "down" for h2h/spreads; for totals,
-      "up" favors Over and "down" favors Under)
-    - Exchange Shift: the side that shortened (exchange thinks more likely)
-    - Rapid Change: the side with the larger delta
-    - Pinnacle Divergence: already fires only for the value side, but
-      falls through to generic tiebreaker if both sides appear.
-    """
-    if len(sigs) == 1:
-        return sigs[0]
 
-    sig_type = sigs[0].signal_type
-    market = sigs[0].market_key
+def _pick_steam(sigs: list[Signal], market: str) -> Signal | None:
+    """Steam Move: value is at stale books on the side where the line moved
+    AGAINST bettors.
 
-    if sig_type == SignalType.REVERSE_LINE:
-        # Follow Pinnacle: keep the side where Pinnacle moved favorably
-        for s in sigs:
-            if s.details.get("pinnacle_delta", 0) > 0:
+    h2h/spreads: "down" means the line got worse for this side's bettors →
+    stale books still on the old (better) line. Totals: "up" favors Over
+    (lower stale total easier to clear), "down" favors Under (higher stale
+    total easier to stay under).
+    """
+    for s in sigs:
+        direction = s.details.get("direction", "")
+        if market == "totals":
+            if s.outcome_name.lower() == "over" and direction == "up":
+                return s
+            if s.outcome_name.lower() == "under" and direction == "down":
                 return s
+        elif direction == "down":
+            return s
+    return None
 
-    elif sig_type == SignalType.STEAM_MOVE:
-        # Value is at stale books on the side where the line moved AGAINST
-        # bettors.  h2h/spreads: "down" means the line got worse for this
-        # side's bettors → stale books still on the old (better) line.
-        # Totals: "up" favors Over (lower stale total easier to clear),
-        # "down" favors Under (higher stale total easier to stay under).
-        for s in sigs:
-            direction = s.details.get("direction", "")
-            if market == "totals":
-                if s.outcome_name.lower() == "over" and direction == "up":
-                    return s
-                if s.outcome_name.lower() == "under" and direction == "down":
-                    return s
-            else:
-                if direction == "down":
-                    return s
 
-    elif sig_type == SignalType.EXCHANGE_SHIFT:
-        # Prefer the side the exchange shortened (thinks more likely)
-        for s in sigs:
-            if s.details.get("direction") == "shortened":
-                return s
+def _pick_exchange(sigs: list[Signal], market: str) -> Signal | None:
+    """Exchange Shift: prefer the side the exchange shortened (thinks more likely)."""
+    for s in sigs:
+        if s.details.get("direction") == "shortened":
+            return s
+    return None
 
-    elif sig_type == SignalType.RAPID_CHANGE:
-        # Prefer the side with the larger move
-        return max(sigs, key=lambda s: abs(s.details.get("delta", 0)))
 
-    # Fallback: most value books, then highest strength, then best price for the
-    # bettor. The price tiebreaker only separates otherwise-equal signals (e.g.
-    # PD books at the same number), so a genuinely better line (higher strength)
-    # is never traded away for a worse one — it just stops us posting -130 when
-    # -106 on the same number is available.
-    return max(
-        sigs,
-        key=lambda s: (len(s.details.get("value_books", [])), s.strength, _best_price(s)),
-    )
+def _pick_rapid(sigs: list[Signal], market: str) -> Signal | None:
+    """Rapid Change: prefer the side with the larger move."""
+    return max(sigs, key=lambda s: abs(s.details.get("delta", 0)))
+
+
+# Per-type side preference, built once at import. A picker returns None when
+# no side matches its rule, deferring to the generic fallback. Pinnacle
+# Divergence has no entry — it already fires only for the value side.
+_PICKERS: dict[SignalType, Callable[[list[Signal], str], Signal | None]] = {
+    SignalType.REVERSE_LINE: _pick_reverse,
+    SignalType.STEAM_MOVE: _pick_steam,
+    SignalType.EXCHANGE_SHIFT: _pick_exchange,
+    SignalType.RAPID_CHANGE: _pick_rapid,
+}
+
+
+def _pick_fallback(sigs: list[Signal]) -> Signal:
+    """Most value books, then highest strength, then best price for the bettor.
+
+    The price tiebreaker only separates otherwise-equal signals (e.g. PD books
+    at the same number), so a genuinely better line (higher strength) is never
+    traded away for a worse one — it just stops us posting -130 when -106 on
+    the same number is available. Since it only matters on a tie, the price
+    scan over value books is done lazily rather than for every signal.
+    """
+    best = sigs[0]
+    best_key = (len(best.details.get("value_books", ())), best.strength)
+    best_price: float | None = None
+    for s in sigs[1:]:
+        key = (len(s.details.get("value_books", ())), s.strength)
+        if key < best_key:
+            continue
+        if key == best_key:
+            if best_price is None:
+                best_price = _best_price(best)
+            price = _best_price(s)
+            if price <= best_price:
+                continue
+            best_price = price
+        else:
+            best_price = None
+        best, best_key = s, key
+    return best
+
+
+def _pick_best_signal(sigs: list[Signal]) -> Signal:
+    """From mirror-side signals, pick the most actionable one.
+
+    Each signal type has a preferred side based on its directional context
+    (see the ``_pick_*`` helpers registered in ``_PICKERS``); types without a
+    picker, or groups where the picker finds no match, fall through to the
+    generic ``_pick_fallback`` tiebreaker.
+    """
+    if len(sigs) == 1:
+        return sigs[0]
+
+    picker = _PICKERS.get(sigs[0].signal_type)
+    best = picker(sigs, sigs[0].market_key) if picker else None
+    return best if best is not None else _pick_fallback(sigs)
 
 
 class DetectionPipeline:
@@ -148,6 +186,21 @@ class DetectionPipeline:
         ]
         self._blocklist: frozenset[str] = frozenset(settings.signal_blocklist)
 
+    @staticmethod
+    async def _run_detector(
+        detector: BaseDetector, event_id: str, fetched_at: str, cache: RequestCache
+    ) -> list[Signal]:
+        """Run one detector, logging (not raising) its errors so others still run."""
+        try:
+            return await detector.detect(event_id, fetched_at, cache=cache)
+        except Exception:
+            log.exception(
+                "detector_error",
+                detector=type(detector).__name__,
+                event_id=event_id,
+            )
+            return []
+
     def _get_min_strength(self, signal_type: str, market_key: str, sport_key: str) -> float:
         """Resolve min strength via tiered lookup: market > sport > type > global."""
         s = self._settings
@@ -168,23 +221,40 @@ class DetectionPipeline:
         three_key = f"{signal_type}:{sport_key}:{market_key}"
         return two_key in self._blocklist or three_key in self._blocklist
 
-    async def run(self, fetched_at: str) -> list[Signal]:
-        """Run all detectors on all events from a fetch cycle, return deduplicated signals."""
-        event_ids = await self._repo.get_distinct_event_ids_at(fetched_at)
+    async def run(
+        self, fetched_at: str, event_ids: list[str] | None = None
+    ) -> list[Signal]:
+        """Run all detectors on all events from a fetch cycle, return deduplicated signals.
+
+        ``event_ids`` lets a caller that already knows the cycle's events (the
+        backtester) skip the lookup.
+        """
+        if event_ids is None:
+            event_ids = await self._repo.get_distinct_event_ids_at(fetched_at)
         log.info("pipeline_start", event_count=len(event_ids))
+        # One query for the whole cycle lets move-only detectors skip quiet events.
+        moved_event_ids = await self._repo.get_pinnacle_moved_event_ids(fetched_at)
+        # Previous-snapshot sets for every event in one query, seeded per event below.
+        previous_by_event = await self._repo.get_previous_snapshots_at(fetched_at)
+        # Per-signal debug events are built only when they'll be emitted; the
+        # info-level summaries below carry the counts either way.
+        debug_enabled = log.is_enabled_for(logging.DEBUG)
 
         all_signals: list[Signal] = []
         for event_id in event_ids:
-            for detector in self._detectors:
-                try:
-                    signals = await detector.detect(event_id, fetched_at)
-                    all_signals.extend(signals)
-                except Exception:
-                    log.exception(
-                        "detector_error",
-                        detector=type(detector).__name__,
-                        event_id=event_id,
-                    )
+            # Detectors share one snapshot cache per event; dropped after the event.
+            # They run concurrently so one detector's Python work overlaps another's
+            # query on the aiosqlite worker thread; gather keeps detector order.
+            cache = RequestCache()
+            cache.prime_previous(event_id, fetched_at, previous_by_event.get(event_id, []))
+            moved = event_id in moved_event_ids
+            results = await asyncio.gather(*(
+                self._run_detector(detector, event_id, fetched_at, cache)
+                for detector in self._detectors
+                if moved or not detector.requires_pinnacle_move
+            ))
+            for signals in results:
+                all_signals.extend(signals)
 
         # Filter by minimum strength (tiered: market > sport > type > global).
         # Arbs are exempt: their strength encodes profit% (strength = profit%/10),
@@ -290,6 +360,7 @@ class DetectionPipeline:
             grouped[(sig.event_id, sig.signal_type.value, sig.market_key)].append(sig)
 
         deduped_signals: list[Signal] = []
+        side_dropped: Counter[str] = Counter()
         for key, sigs in grouped.items():
             if len(sigs) <= 1:
                 deduped_signals.extend(sigs)
@@ -299,6 +370,9 @@ class DetectionPipeline:
                 # chosen number, best price first (recommendation + alternatives).
                 _merge_same_side_value_books(best, sigs)
                 deduped_signals.append(best)
+                side_dropped[key[1]] += len(sigs) - 1
+                if not debug_enabled:
+                    continue
                 log.debug(
                     "market_side_dedup",
                     event_id=key[0],
@@ -308,6 +382,8 @@ class DetectionPipeline:
                     books=[vb.get("bookmaker") for vb in best.details.get("value_books", [])],
                     dropped=[s.outcome_name for s in sigs if s is not best],
                 )
+        if side_dropped:
+            log.info("market_side_dedup_summary", dropped=dict(side_dropped))
 
         # Require actionable bet: every signal must have value books
         # Arb signals are always actionable (they have side_a/side_b instead)
@@ -321,17 +397,22 @@ class DetectionPipeline:
             after=len(actionable),
         )
 
-        # Deduplicate against recently sent alerts
+        # Deduplicate against recently sent alerts (one query for the cycle)
+        recently_alerted = await self._repo.get_recently_alerted(
+            list({s.event_id for s in actionable}),
+            cooldown_minutes=self._settings.alert_cooldown_minutes,
+        )
         new_signals: list[Signal] = []
+        cooldown_dropped = 0
         for sig in actionable:
-            already_sent = await self._repo.was_alert_sent_recently(
-                event_id=sig.event_id,
-                alert_type=sig.signal_type.value,
-                market_key=sig.market_key,
-                cooldown_minutes=self._settings.alert_cooldown_minutes,
-            )
-            if already_sent:
-                log.debug("signal_deduped", signal_type=sig.signal_type.value, event_id=sig.event_id)
+            if (sig.event_id, sig.signal_type.value, sig.market_key) in recently_alerted:
+                cooldown_dropped += 1
+                if debug_enabled:
+                    log.debug(
+                        "signal_deduped",
+                        signal_type=sig.signal_type.value,
+                        event_id=sig.event_id,
+                    )
                 continue
             new_signals.append(sig)
 
@@ -342,6 +423,7 @@ class DetectionPipeline:
             live_dropped=live_dropped,
             after_side_dedup=len(deduped_signals),
             after_value_filter=len(actionable),
+            cooldown_dropped=cooldown_dropped,
             new_signals=len(new_signals),
         )
         return new_signals
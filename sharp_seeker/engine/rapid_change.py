@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
+import aiosqlite
 import structlog
 
 from sharp_seeker.config import Settings
 from sharp_seeker.db.repository import Repository
-from sharp_seeker.engine.base import BaseDetector, Signal, SignalType
+from sharp_seeker.engine.base import BaseDetector, RequestCache, Signal, SignalType
 from sharp_seeker.engine.hold import (
     collect_market_prices,
     compute_cross_book_hold,
@@ -15,7 +18,7 @@ from sharp_seeker.engine.hold import (
 
 log = structlog.get_logger()
 
-US_BOOKS = {"draftkings", "fanduel", "betmgm", "williamhill_us", "betrivers", "fanatics", "hardrockbet", "espnbet"}
+US_BOOKS = frozenset({"draftkings", "fanduel", "betmgm", "williamhill_us", "betrivers", "fanatics", "hardrockbet", "espnbet"})
 
 
 def _is_steepening(market_key: str, outcome_name: str, old: dict, new: dict) -> bool:
@@ -42,62 +45,68 @@ def _find_other_outcome(
 
 
 class RapidChangeDetector(BaseDetector):
+    requires_pinnacle_move = True
+
     def __init__(self, settings: Settings, repo: Repository) -> None:
         self._settings = settings
         self._repo = repo
 
-    async def detect(self, event_id: str, fetched_at: str) -> list[Signal]:
-        latest = await self._repo.get_latest_snapshots(event_id)
-        previous = await self._repo.get_previous_snapshots(event_id, fetched_at)
+    async def detect(
+        self, event_id: str, fetched_at: str, cache: RequestCache | None = None
+    ) -> list[Signal]:
+        cache = cache or RequestCache()
+        latest = await cache.latest(self._repo, event_id)
+        previous = await cache.previous(self._repo, event_id, fetched_at)
 
         if not latest or not previous:
             return []
 
         # Index previous by (bookmaker, market, outcome)
-        prev_map: dict[tuple[str, str, str], dict] = {}
+        prev_map: dict[tuple[str, str, str], aiosqlite.Row] = {}
         for row in previous:
             key = (row["bookmaker_key"], row["market_key"], row["outcome_name"])
-            prev_map[key] = dict(row)
-
-        # Index ALL current lines by (market, outcome, bookmaker)
-        current_lines: dict[tuple[str, str, str], dict] = {}
-        for _row in latest:
-            row = dict(_row)
-            current_lines[(row["market_key"], row["outcome_name"], row["bookmaker_key"])] = row
-
-        meta: tuple[str, str, str, str] | None = None
+            prev_map[key] = row
+
+        # Index ALL current lines by (market, outcome, bookmaker), plus the US
+        # books per side so value-book scans only visit candidate rows. Rows
+        # are read in place — nothing below mutates them, so no dict copies.
+        current_lines: dict[tuple[str, str, str], aiosqlite.Row] = {}
+        us_by_side: dict[tuple[str, str], list[tuple[str, aiosqlite.Row]]] = {}
+        # Only Pinnacle moves can signal, so those are the only rows the
+        # delta/threshold pass below needs to visit.
+        pinnacle_rows: list[aiosqlite.Row] = []
+        for row in latest:
+            mk, on, bm = row["market_key"], row["outcome_name"], row["bookmaker_key"]
+            current_lines[(mk, on, bm)] = row
+            if bm in US_BOOKS:
+                us_by_side.setdefault((mk, on), []).append((bm, row))
+            elif bm == "pinnacle":
+                pinnacle_rows.append(row)
+
+        ml_threshold = self._settings.rapid_ml_threshold
+        spread_threshold = self._settings.rapid_spread_threshold
         signals: list[Signal] = []
 
-        for _row in latest:
-            row = dict(_row)
-            key = (row["bookmaker_key"], row["market_key"], row["outcome_name"])
-            prev = prev_map.get(key)
-            if prev is None:
-                continue
-
-            if meta is None:
-                meta = (row["sport_key"], row["home_team"], row["away_team"], row["commence_time"])
-
+        for row in pinnacle_rows:
             market_key = row["market_key"]
             bm = row["bookmaker_key"]
+            prev = prev_map.get((bm, market_key, row["outcome_name"]))
+            if prev is None:
+                continue
 
             if market_key == "h2h":
                 delta = abs(row["price"] - prev["price"])
-                threshold = self._settings.rapid_ml_threshold
+                threshold = ml_threshold
             else:
                 if row["point"] is not None and prev["point"] is not None:
                     delta = abs(row["point"] - prev["point"])
-                    threshold = self._settings.rapid_spread_threshold
+                    threshold = spread_threshold
                 else:
                     continue
 
             if delta <= threshold:
                 continue
 
-            # Only signal when Pinnacle moves — the sharpest book
-            if bm != "pinnacle":
-                continue
-
             strength = min(1.0, delta / (threshold * 3))
             steepening = _is_steepening(market_key, row["outcome_name"], prev, row)
 
@@ -106,7 +115,8 @@ class RapidChangeDetector(BaseDetector):
                 # find US books still at the old (better) line.
                 signal_outcome = row["outcome_name"]
                 value_books = self._find_stale_books(
-                    market_key, signal_outcome, current_lines, prev, row,
+                    market_key, signal_outcome,
+                    us_by_side.get((market_key, signal_outcome), []), prev, row,
                 )
             else:
                 # Pinnacle shortened this outcome — sharp money is on the
@@ -120,7 +130,8 @@ class RapidChangeDetector(BaseDetector):
                 if not pin_other:
                     continue
                 value_books = self._find_better_than_pinnacle(
-                    market_key, other_outcome, current_lines, pin_other,
+                    market_key, other_outcome,
+                    us_by_side.get((market_key, other_outcome), []), pin_other,
                 )
                 if not value_books:
                     continue  # no US book beats Pinnacle on the other side
@@ -139,10 +150,10 @@ class RapidChangeDetector(BaseDetector):
                 Signal(
                     signal_type=SignalType.RAPID_CHANGE,
                     event_id=event_id,
-                    sport_key=meta[0],
-                    home_team=meta[1],
-                    away_team=meta[2],
-                    commence_time=meta[3],
+                    sport_key=row["sport_key"],
+                    home_team=row["home_team"],
+                    away_team=row["away_team"],
+                    commence_time=row["commence_time"],
                     market_key=market_key,
                     outcome_name=signal_outcome,
                     strength=round(strength, 2),
@@ -154,8 +165,8 @@ class RapidChangeDetector(BaseDetector):
                         "bookmaker": bm,
                         "old_price": prev["price"],
                         "new_price": row["price"],
-                        "old_point": prev.get("point"),
-                        "new_point": row.get("point"),
+                        "old_point": prev["point"],
+                        "new_point": row["point"],
                         "delta": round(delta, 2),
                         "value_books": value_books,
                         "us_hold": round(us_hold, 4) if us_hold is not None else None,
@@ -170,60 +181,60 @@ class RapidChangeDetector(BaseDetector):
     def _find_stale_books(
         market_key: str,
         outcome_name: str,
-        current_lines: dict,
-        prev: dict,
-        new: dict,
+        us_rows: list[tuple[str, aiosqlite.Row]],
+        prev: aiosqlite.Row,
+        new: aiosqlite.Row,
     ) -> list[dict]:
-        """Find US books still at the old (stale) line — value for steepening moves."""
-        if market_key == "h2h":
-            new_val = new["price"]
-            old_val = prev["price"]
-        else:
-            new_val = new["point"]
-            old_val = prev.get("point", prev["price"])
+        """Find US books still at the old (stale) line — value for steepening moves.
+
+        ``us_rows`` is this side's current US-book lines as (bookmaker, row).
+        """
+        # Loop-invariant: which column we compare, and the old/new line on it.
+        val_col = "price" if market_key == "h2h" else "point"
+        new_val = new[val_col]
+        old_val = prev[val_col] if prev[val_col] is not None else prev["price"]
 
         value_books: list[dict] = []
-        for (mk, on, other_bm), other_row in current_lines.items():
-            if mk != market_key or on != outcome_name or other_bm not in US_BOOKS:
-                continue
-            if market_key == "h2h":
-                other_val = other_row["price"]
-            elif other_row["point"] is not None:
-                other_val = other_row["point"]
-            else:
+        for other_bm, other_row in us_rows:
+            other_val = other_row[val_col]
+            if other_val is None:
                 continue
             # Book is "stale" if it's closer to the old line than the new one
-            if abs(other_val - old_val) < abs(other_val - new_val):
+            # (squared distances — same ordering as abs(), no calls)
+            d_old = other_val - old_val
+            d_new = other_val - new_val
+            if d_old * d_old < d_new * d_new:
                 value_books.append({
                     "bookmaker": other_bm,
                     "price": other_row["price"],
-                    "point": other_row.get("point"),
-                    "deep_link": other_row.get("deep_link"),
+                    "point": other_row["point"],
+                    "deep_link": other_row["deep_link"],
                 })
 
-        value_books.sort(key=lambda vb: _value_sort_key(market_key, outcome_name, vb), reverse=True)
+        value_books.sort(key=_value_sort_key(market_key, outcome_name), reverse=True)
         return value_books
 
     @staticmethod
     def _find_better_than_pinnacle(
         market_key: str,
         outcome_name: str,
-        current_lines: dict,
-        pin_row: dict,
+        us_rows: list[tuple[str, aiosqlite.Row]],
+        pin_row: aiosqlite.Row,
     ) -> list[dict]:
-        """Find US books offering a better price than Pinnacle on this outcome."""
+        """Find US books offering a better price than Pinnacle on this outcome.
+
+        ``us_rows`` is this side's current US-book lines as (bookmaker, row).
+        """
         value_books: list[dict] = []
-        for (mk, on, other_bm), other_row in current_lines.items():
-            if mk != market_key or on != outcome_name or other_bm not in US_BOOKS:
-                continue
+        for other_bm, other_row in us_rows:
             if market_key == "h2h":
                 # Higher (more positive / less negative) price = better for bettor
                 if other_row["price"] > pin_row["price"]:
                     value_books.append({
                         "bookmaker": other_bm,
                         "price": other_row["price"],
-                        "point": other_row.get("point"),
-                        "deep_link": other_row.get("deep_link"),
+                        "point": other_row["point"],
+                        "deep_link": other_row["deep_link"],
                     })
             else:
                 if other_row["point"] is None or pin_row["point"] is None:
@@ -235,7 +246,7 @@ class RapidChangeDetector(BaseDetector):
                             "bookmaker": other_bm,
                             "price": other_row["price"],
                             "point": other_row["point"],
-                            "deep_link": other_row.get("deep_link"),
+                            "deep_link": other_row["deep_link"],
                         })
                 elif market_key == "totals" and outcome_name.lower() == "under":
                     # Higher point = easier under = better
@@ -244,7 +255,7 @@ class RapidChangeDetector(BaseDetector):
                             "bookmaker": other_bm,
                             "price": other_row["price"],
                             "point": other_row["point"],
-                            "deep_link": other_row.get("deep_link"),
+                            "deep_link": other_row["deep_link"],
                         })
                 else:
                     # Spreads: more positive point = better for bettor
@@ -253,19 +264,31 @@ class RapidChangeDetector(BaseDetector):
                             "bookmaker": other_bm,
                             "price": other_row["price"],
                             "point": other_row["point"],
-                            "deep_link": other_row.get("deep_link"),
+                            "deep_link": other_row["deep_link"],
                         })
 
-        value_books.sort(key=lambda vb: _value_sort_key(market_key, outcome_name, vb), reverse=True)
+        value_books.sort(key=_value_sort_key(market_key, outcome_name), reverse=True)
         return value_books
 
 
-def _value_sort_key(market_key: str, outcome_name: str, vb: dict) -> float:
-    if market_key == "h2h":
-        return vb.get("price") or 0
+def _price_key(vb: dict) -> float:
+    return vb.get("price") or 0
+
+
+def _point_key(vb: dict) -> float:
+    pt = vb.get("point")
+    return 0 if pt is None else pt
+
+
+def _neg_point_key(vb: dict) -> float:
     pt = vb.get("point")
-    if pt is None:
-        return 0
+    return 0 if pt is None else -pt
+
+
+def _value_sort_key(market_key: str, outcome_name: str) -> Callable[[dict], float]:
+    """Pick the value-book sort key once per side (best line sorts highest)."""
+    if market_key == "h2h":
+        return _price_key
     if market_key == "totals" and outcome_name.lower() == "over":
-        return -pt
-    return pt
+        return _neg_point_key
+    return _point_key
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from datetime import datetime, timedelta
 
 import structlog
 
 from sharp_seeker.config import Settings
 from sharp_seeker.db.repository import Repository
-from sharp_seeker.engine.base import BaseDetector, Signal, SignalType
+from sharp_seeker.engine.base import (
+    BaseDetector,
+    RequestCache,
+    Signal,
+    SignalType,
+    window_start_iso,
+)
 from sharp_seeker.engine.hold import (
     collect_market_prices,
     compute_cross_book_hold,
@@ -19,7 +24,10 @@ from sharp_seeker.engine.pinnacle_divergence import _us_has_better_value
 log = structlog.get_logger()
 
 PINNACLE_KEY = "pinnacle"
-US_BOOKS = {"draftkings", "fanduel", "betmgm", "williamhill_us", "betrivers", "fanatics", "hardrockbet", "espnbet"}
+US_BOOKS = frozenset({"draftkings", "fanduel", "betmgm", "williamhill_us", "betrivers", "fanatics", "hardrockbet", "espnbet"})
+
+# (first (price, point), last (price, point), snapshot count) for one book's window
+_Endpoints = tuple[tuple[float, float | None], tuple[float, float | None], int]
 
 
 class ReverseLineDetector(BaseDetector):
@@ -27,62 +35,60 @@ class ReverseLineDetector(BaseDetector):
         self._settings = settings
         self._repo = repo
 
-    async def detect(self, event_id: str, fetched_at: str) -> list[Signal]:
-        window_start = (
-            datetime.fromisoformat(fetched_at)
-            - timedelta(minutes=self._settings.steam_window_minutes)
-        ).isoformat()
-
-        snapshots = await self._repo.get_snapshots_since(event_id, window_start)
-        if not snapshots:
-            return []
-
-        # Group by (market, outcome) → {bookmaker → list of (fetched_at, price, point)}
-        grouped: dict[tuple[str, str], dict[str, list[tuple[str, float, float | None]]]] = (
-            defaultdict(lambda: defaultdict(list))
-        )
-        meta: tuple[str, str, str, str] | None = None
-
-        for snap in snapshots:
-            key = (snap["market_key"], snap["outcome_name"])
-            grouped[key][snap["bookmaker_key"]].append(
-                (snap["fetched_at"], snap["price"], snap["point"])
-            )
-            if meta is None:
-                meta = (snap["sport_key"], snap["home_team"], snap["away_team"], snap["commence_time"])
+    async def detect(
+        self, event_id: str, fetched_at: str, cache: RequestCache | None = None
+    ) -> list[Signal]:
+        cache = cache or RequestCache()
+        window_start = window_start_iso(fetched_at, self._settings.steam_window_minutes)
 
-        if meta is None:
+        endpoints = await cache.window_endpoints(self._repo, event_id, window_start)
+        if not endpoints:
             return []
 
-        # Build current lines for value book detection
-        latest = await self._repo.get_latest_snapshots(event_id)
+        # Group by (market, outcome) → {bookmaker → (first, last, count)}, where
+        # first/last are (price, point) — the window reduction is done in SQL.
+        # Combos whose last row is from the latest fetch are the current lines
+        # for value book detection, so no separate latest-snapshot read.
+        grouped: dict[tuple[str, str], dict[str, _Endpoints]] = defaultdict(dict)
         current_lines: dict[tuple[str, str, str], dict] = {}
-        for _row in latest:
-            row = dict(_row)
-            mk, on, bm = row["market_key"], row["outcome_name"], row["bookmaker_key"]
-            current_lines[(mk, on, bm)] = row
+        for ep in endpoints:
+            mk, on, bm = ep["market_key"], ep["outcome_name"], ep["bookmaker_key"]
+            grouped[(mk, on)][bm] = (
+                (ep["first_price"], ep["first_point"]),
+                (ep["last_price"], ep["last_point"]),
+                ep["n"],
+            )
+            if ep["is_latest"]:
+                current_lines[(mk, on, bm)] = {
+                    "price": ep["last_price"],
+                    "point": ep["last_point"],
+                    "deep_link": ep["last_deep_link"],
+                }
+        first_ep = endpoints[0]
+        meta = (
+            first_ep["sport_key"], first_ep["home_team"],
+            first_ep["away_team"], first_ep["commence_time"],
+        )
 
         signals: list[Signal] = []
 
         for (market_key, outcome_name), book_data in grouped.items():
             # Get Pinnacle's movement direction
-            pin_entries = book_data.get(PINNACLE_KEY)
-            if not pin_entries or len(pin_entries) < 2:
+            pin_ep = book_data.get(PINNACLE_KEY)
+            if pin_ep is None or pin_ep[2] < 2:
                 continue
 
-            pin_entries.sort(key=lambda e: e[0])
-            pin_delta = self._calc_delta(market_key, pin_entries[0], pin_entries[-1])
+            pin_delta = self._calc_delta(market_key, pin_ep[0], pin_ep[1])
             if pin_delta == 0:
                 continue
 
             # Get US consensus direction (average delta across US books that moved)
             us_deltas: list[float] = []
             us_movers: list[str] = []
-            for bm_key, entries in book_data.items():
-                if bm_key not in US_BOOKS or len(entries) < 2:
+            for bm_key, (first, last, n) in book_data.items():
+                if bm_key not in US_BOOKS or n < 2:
                     continue
-                entries.sort(key=lambda e: e[0])
-                delta = self._calc_delta(market_key, entries[0], entries[-1])
+                delta = self._calc_delta(market_key, first, last)
                 if delta != 0:
                     us_deltas.append(delta)
                     us_movers.append(bm_key)
@@ -179,11 +185,11 @@ class ReverseLineDetector(BaseDetector):
     @staticmethod
     def _calc_delta(
         market_key: str,
-        first: tuple[str, float, float | None],
-        last: tuple[str, float, float | None],
+        first: tuple[float, float | None],
+        last: tuple[float, float | None],
     ) -> float:
         if market_key == "h2h":
+            return last[0] - first[0]
+        if first[1] is not None and last[1] is not None:
             return last[1] - first[1]
-        if first[2] is not None and last[2] is not None:
-            return last[2] - first[2]
-        return last[1] - first[1]
+        return last[0] - first[0]
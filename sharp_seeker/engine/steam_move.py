@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from datetime import datetime, timedelta, timezone
 
 import structlog
 
 from sharp_seeker.config import Settings
 from sharp_seeker.db.repository import Repository
-from sharp_seeker.engine.base import BaseDetector, Signal, SignalType
+from sharp_seeker.engine.base import (
+    BaseDetector,
+    RequestCache,
+    Signal,
+    SignalType,
+    window_start_iso,
+)
 from sharp_seeker.engine.hold import (
     collect_market_prices,
     compute_cross_book_hold,
@@ -18,7 +23,7 @@ from sharp_seeker.engine.hold import (
 
 log = structlog.get_logger()
 
-US_BOOKS = {"draftkings", "fanduel", "betmgm", "williamhill_us", "betrivers", "fanatics", "hardrockbet", "espnbet"}
+US_BOOKS = frozenset({"draftkings", "fanduel", "betmgm", "williamhill_us", "betrivers", "fanatics", "hardrockbet", "espnbet"})
 
 
 class SteamMoveDetector(BaseDetector):
@@ -26,77 +31,83 @@ class SteamMoveDetector(BaseDetector):
         self._settings = settings
         self._repo = repo
 
-    async def detect(self, event_id: str, fetched_at: str) -> list[Signal]:
-        window_start = (
-            datetime.fromisoformat(fetched_at)
-            - timedelta(minutes=self._settings.steam_window_minutes)
-        ).isoformat()
+    async def detect(
+        self, event_id: str, fetched_at: str, cache: RequestCache | None = None
+    ) -> list[Signal]:
+        cache = cache or RequestCache()
+        window_start = window_start_iso(fetched_at, self._settings.steam_window_minutes)
 
-        snapshots = await self._repo.get_snapshots_since(event_id, window_start)
-        if not snapshots:
+        # First/last per bookmaker/market/outcome is reduced in SQL
+        endpoints = await cache.window_endpoints(self._repo, event_id, window_start)
+        if not endpoints:
             return []
 
-        # Group by (market, outcome) → {bookmaker → list of (fetched_at, price, point)}
-        grouped: dict[tuple[str, str], dict[str, list[tuple[str, float, float | None]]]] = (
-            defaultdict(lambda: defaultdict(list))
-        )
-        meta: dict[str, tuple[str, str, str, str]] = {}
-
-        for snap in snapshots:
-            key = (snap["market_key"], snap["outcome_name"])
-            grouped[key][snap["bookmaker_key"]].append(
-                (snap["fetched_at"], snap["price"], snap["point"])
-            )
-            if event_id not in meta:
-                meta[event_id] = (snap["sport_key"], snap["home_team"], snap["away_team"], snap["commence_time"])
-
-        sport_key, home, away, commence_time = meta.get(event_id, ("", "", "", ""))
-
-        # Build current lines for value book detection
-        latest = await self._repo.get_latest_snapshots(event_id)
+        # Group by (market, outcome) → {bookmaker → window delta}. The delta is
+        # all the direction pass needs, so it's reduced here (None when the book
+        # has fewer than two snapshots in the window). Combos whose last row is
+        # from the latest fetch double as current lines for value books, so no
+        # separate latest-snapshot read is needed.
+        grouped: dict[tuple[str, str], dict[str, float | None]] = defaultdict(dict)
         current_lines: dict[tuple[str, str, str], dict] = {}
-        for _row in latest:
-            row = dict(_row)
+        for row in endpoints:
             mk, on, bm = row["market_key"], row["outcome_name"], row["bookmaker_key"]
-            current_lines[(mk, on, bm)] = row
+            if row["n"] < 2:
+                delta = None
+            elif mk == "h2h":
+                delta = row["last_price"] - row["first_price"]  # price diff
+            else:
+                # spreads/totals: use point diff
+                first_point, last_point = row["first_point"], row["last_point"]
+                if first_point is not None and last_point is not None:
+                    delta = last_point - first_point
+                else:
+                    delta = row["last_price"] - row["first_price"]
+            grouped[(mk, on)][bm] = delta
+            if row["is_latest"]:
+                current_lines[(mk, on, bm)] = {
+                    "price": row["last_price"],
+                    "point": row["last_point"],
+                    "deep_link": row["last_deep_link"],
+                }
+
+        head = endpoints[0]
+        sport_key, home, away, commence_time = (
+            head["sport_key"], head["home_team"], head["away_team"], head["commence_time"],
+        )
 
+        us_books = US_BOOKS
+        min_books = self._settings.steam_min_books
+        get_current = current_lines.get
         signals: list[Signal] = []
 
         for (market_key, outcome_name), book_data in grouped.items():
-            # For each book, compute direction of movement (first → last in window)
-            moves: list[tuple[str, float]] = []  # (bookmaker, delta)
-            for bm_key, entries in book_data.items():
-                if len(entries) < 2:
-                    continue
-                entries.sort(key=lambda e: e[0])
-                first = entries[0]
-                last = entries[-1]
-
-                if market_key == "h2h":
-                    delta = last[1] - first[1]  # price diff
-                else:
-                    # spreads/totals: use point diff
-                    if first[2] is not None and last[2] is not None:
-                        delta = last[2] - first[2]
-                    else:
-                        delta = last[1] - first[1]
-
-                if delta != 0:
-                    moves.append((bm_key, delta))
-
-            if len(moves) < self._settings.steam_min_books:
+            # Fewer books than min_books can never produce enough movers
+            if len(book_data) < min_books:
                 continue
 
-            # Check if majority move in same direction
-            up = [m for m in moves if m[1] > 0]
-            down = [m for m in moves if m[1] < 0]
-
-            aligned = max(up, down, key=len)
-            if len(aligned) < self._settings.steam_min_books:
+            # Tally each book's direction of movement: (bookmaker, delta), with
+            # running |delta| sums so the winning side's average needs no rescan
+            up: list[tuple[str, float]] = []
+            down: list[tuple[str, float]] = []
+            up_sum = down_sum = 0.0
+            for bm_key, delta in book_data.items():
+                if delta is None:
+                    continue
+                if delta > 0:
+                    up.append((bm_key, delta))
+                    up_sum += delta
+                elif delta < 0:
+                    down.append((bm_key, delta))
+                    down_sum -= delta
+
+            # Majority direction; ties go to "up"
+            if len(up) >= len(down):
+                aligned, direction, abs_sum = up, "up", up_sum
+            else:
+                aligned, direction, abs_sum = down, "down", down_sum
+            if len(aligned) < min_books:
                 continue
 
-            direction = "up" if aligned is up else "down"
-
             # Directional gate: emit ONLY the side bettors should actually take,
             # so a single signal that survives upstream filters can never be the
             # wrong (lengthening) side. This mirrors _pick_best_signal exactly —
@@ -117,13 +128,15 @@ class SteamMoveDetector(BaseDetector):
             if not is_bet_side:
                 continue
 
-            avg_delta = sum(abs(m[1]) for m in aligned) / len(aligned)
+            avg_delta = abs_sum / len(aligned)
             strength = min(1.0, len(aligned) / max(len(book_data), 1))
 
             book_details = []
+            moved_books: set[str] = set()
             for bm_key, d in aligned:
+                moved_books.add(bm_key)
                 entry: dict = {"bookmaker": bm_key, "delta": round(d, 2)}
-                current = current_lines.get((market_key, outcome_name, bm_key))
+                current = get_current((market_key, outcome_name, bm_key))
                 if current is not None:
                     entry["price"] = current["price"]
                     entry["point"] = current.get("point")
@@ -131,13 +144,12 @@ class SteamMoveDetector(BaseDetector):
                 book_details.append(entry)
 
             # Find books that haven't moved yet (stale lines = value bets)
-            moved_books = {bm for bm, _ in aligned}
             value_books: list[dict] = []
-            for bm_key, entries in book_data.items():
-                if bm_key in moved_books or bm_key not in US_BOOKS:
+            for bm_key in book_data:
+                if bm_key in moved_books or bm_key not in us_books:
                     continue
                 # This book didn't move — still on old line
-                current = current_lines.get((market_key, outcome_name, bm_key))
+                current = get_current((market_key, outcome_name, bm_key))
                 if current is not None:
                     value_books.append({
                         "bookmaker": bm_key,
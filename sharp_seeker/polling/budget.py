@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from datetime import datetime, timezone
 
 import structlog
@@ -16,16 +18,35 @@ LOGO_URL = "https://raw.githubusercontent.com/nathan1324/sharp-seeker/main/asset
 
 CREDITS_PER_POLL = 9  # 3 sports x 3 credits each (3 markets x 1 region-equivalent)
 
+# Credits only change when a poll records usage, which calls invalidate();
+# the TTL just bounds staleness for usage recorded elsewhere.
+REMAINING_CACHE_TTL_SECONDS = 30.0
+
 
 class BudgetTracker:
     def __init__(self, settings: Settings, repo: Repository) -> None:
         self._settings = settings
         self._repo = repo
         self._low_budget_warned = False
+        self._cached_remaining: tuple[float, int | None] | None = None  # (monotonic, value)
+
+    def invalidate(self) -> None:
+        """Drop the cached credits-remaining value (call after recording API usage)."""
+        self._cached_remaining = None
+
+    async def _get_remaining(self) -> int | None:
+        """Credits remaining, re-read from the DB at most once per TTL."""
+        now = time.monotonic()
+        cached = self._cached_remaining
+        if cached is not None and now - cached[0] < REMAINING_CACHE_TTL_SECONDS:
+            return cached[1]
+        remaining = await self._repo.get_credits_remaining()
+        self._cached_remaining = (now, remaining)
+        return remaining
 
     async def should_poll(self) -> bool:
         """Check if we have enough budget to poll. Returns False if below 10% threshold."""
-        remaining = await self._repo.get_credits_remaining()
+        remaining = await self._get_remaining()
         if remaining is None:
             return True  # no data yet, assume OK
 
@@ -39,7 +60,7 @@ class BudgetTracker:
             )
             if not self._low_budget_warned:
                 self._low_budget_warned = True
-                self._send_budget_warning(remaining)
+                await self._send_budget_warning(remaining)
             return False
 
         if remaining < CREDITS_PER_POLL:
@@ -50,7 +71,7 @@ class BudgetTracker:
 
     async def get_status(self) -> dict:
         """Return current budget status."""
-        remaining = await self._repo.get_credits_remaining()
+        remaining = await self._get_remaining()
         monthly = self._settings.odds_api_monthly_credits
         used = (monthly - remaining) if remaining is not None else 0
         return {
@@ -62,12 +83,12 @@ class BudgetTracker:
 
     async def send_daily_summary(self) -> None:
         """Send a daily budget summary to Discord."""
-        status = await self.get_status()
-        alerts_today = await self._repo.get_alerts_count_since(
-            self._today_start_iso()
-        )
-        polls_today = await self._repo.get_poll_count_since(
-            self._today_start_iso()
+        today_start = self._today_start_iso()
+        # Independent reads — issue them together rather than one after another
+        status, alerts_today, polls_today = await asyncio.gather(
+            self.get_status(),
+            self._repo.get_alerts_count_since(today_start),
+            self._repo.get_poll_count_since(today_start),
         )
 
         webhook = DiscordWebhook(url=self._settings.discord_webhook_url)
@@ -101,14 +122,15 @@ class BudgetTracker:
         embed.set_footer(text="Sandbox Sports", icon_url=LOGO_URL)
 
         webhook.add_embed(embed)
-        resp = webhook.execute()
+        # discord_webhook is blocking; keep the event loop (and polls) running
+        resp = await asyncio.to_thread(webhook.execute)
 
         if resp and hasattr(resp, "status_code") and resp.status_code < 400:
             log.info("daily_summary_sent")
         else:
             log.error("daily_summary_failed")
 
-    def _send_budget_warning(self, remaining: int) -> None:
+    async def _send_budget_warning(self, remaining: int) -> None:
         """Send a one-time low budget warning to Discord."""
         webhook = DiscordWebhook(url=self._settings.discord_webhook_url)
         embed = DiscordEmbed(
@@ -123,7 +145,7 @@ class BudgetTracker:
         embed.set_timestamp(datetime.now(timezone.utc).isoformat())
         embed.set_footer(text="Sandbox Sports", icon_url=LOGO_URL)
         webhook.add_embed(embed)
-        webhook.execute()
+        await asyncio.to_thread(webhook.execute)
 
     @staticmethod
     def _today_start_iso() -> str:
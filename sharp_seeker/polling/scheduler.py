@@ -21,6 +21,18 @@ from sharp_seeker.polling.budget import BudgetTracker
 log = structlog.get_logger()
 
 
+def _quiet_hours_mask(start: int, end: int) -> int:
+    """Bitmask of UTC hours (bit h set = hour h is quiet), wrapping past midnight."""
+    if start < end:
+        hours = range(start, end)
+    else:
+        hours = [h for h in range(24) if h >= start or h < end]
+    mask = 0
+    for h in hours:
+        mask |= 1 << h
+    return mask
+
+
 class Poller:
     def __init__(
         self,
@@ -46,19 +58,14 @@ class Poller:
         self._grader = grader
         self._card_gen = card_gen
         self._cycle_count = 0
+        self._quiet_mask = _quiet_hours_mask(
+            settings.quiet_hours_start, settings.quiet_hours_end
+        )
 
     async def poll_cycle(self) -> None:
         """Execute one full poll → detect → alert → track cycle."""
         now = datetime.now(timezone.utc)
-        start = self._settings.quiet_hours_start
-        end = self._settings.quiet_hours_end
-
-        if start < end:
-            in_quiet = start <= now.hour < end
-        else:
-            in_quiet = now.hour >= start or now.hour < end
-
-        if in_quiet:
+        if (self._quiet_mask >> now.hour) & 1:
             log.info("poll_skipped_quiet_hours", hour_utc=now.hour)
             return
 
@@ -76,6 +83,9 @@ class Poller:
         except Exception:
             log.exception("poll_fetch_error")
             return
+        finally:
+            # The fetch records fresh credit usage; don't serve the old count.
+            self._budget.invalidate()
 
         if not results:
             log.info("poll_no_data")
@@ -152,7 +162,13 @@ class Poller:
 
 def create_scheduler(poller: Poller, settings: Settings) -> AsyncIOScheduler:
     """Create and configure the APScheduler instance."""
-    scheduler = AsyncIOScheduler()
+    # Cron times below are UTC; pin the scheduler to UTC so triggers don't
+    # consult the host's local zone. Missed runs (e.g. after a stall) collapse
+    # into one and never overlap a still-running instance.
+    scheduler = AsyncIOScheduler(
+        timezone=timezone.utc,
+        job_defaults={"coalesce": True, "max_instances": 1},
+    )
 
     scheduler.add_job(
         poller.poll_cycle,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from enum import IntEnum
+from functools import lru_cache
 
 import structlog
 
@@ -18,27 +19,48 @@ class PollPriority(IntEnum):
     LOW = 4     # beyond 12 hours — poll every 4th cycle
 
 
-def classify_event(event: EventOddsSchema) -> PollPriority:
-    """Classify an event's polling priority based on time until commence."""
+@lru_cache(maxsize=4096)
+def _parse_commence(commence_time: str) -> float | None:
+    """Parse a commence time to epoch seconds once; the same events recur every cycle."""
     try:
-        commence = datetime.fromisoformat(event.commence_time)
+        return datetime.fromisoformat(commence_time).timestamp()
     except (ValueError, TypeError):
+        return None
+
+
+# Upper bounds (seconds until commence) for each priority, checked in order
+_PRIORITY_WINDOWS = (
+    (2 * 3600, PollPriority.HIGH),
+    (12 * 3600, PollPriority.MEDIUM),
+)
+
+
+def classify_event(
+    event: EventOddsSchema, now: datetime | None = None
+) -> PollPriority:
+    """Classify an event's polling priority based on time until commence.
+
+    ``now`` lets a caller classifying a batch of events read the clock once.
+    """
+    commence = _parse_commence(event.commence_time)
+    if commence is None:
         return PollPriority.HIGH  # if we can't parse, default to high priority
 
-    now = datetime.now(timezone.utc)
-    hours_until = (commence - now).total_seconds() / 3600
+    if now is None:
+        now = datetime.now(timezone.utc)
+    until = commence - now.timestamp()
 
-    if hours_until <= 2:
-        return PollPriority.HIGH
-    elif hours_until <= 12:
-        return PollPriority.MEDIUM
-    else:
-        return PollPriority.LOW
+    for bound, priority in _PRIORITY_WINDOWS:
+        if until <= bound:
+            return priority
+    return PollPriority.LOW
 
 
-def should_poll_event(event: EventOddsSchema, cycle_count: int) -> bool:
+def should_poll_event(
+    event: EventOddsSchema, cycle_count: int, now: datetime | None = None
+) -> bool:
     """Determine if an event should be polled on this cycle number."""
-    priority = classify_event(event)
+    priority = classify_event(event, now)
     return cycle_count % priority == 0
 
 
@@ -46,13 +68,11 @@ def filter_events_for_cycle(
     events: list[EventOddsSchema], cycle_count: int
 ) -> list[EventOddsSchema]:
     """Filter events based on smart polling priority for the current cycle."""
-    included = []
-    skipped = 0
-    for event in events:
-        if should_poll_event(event, cycle_count):
-            included.append(event)
-        else:
-            skipped += 1
+    now = datetime.now(timezone.utc)
+    # Which priorities are due depends only on cycle_count — test it once
+    due = frozenset(p for p in PollPriority if cycle_count % p == 0)
+    included = [e for e in events if classify_event(e, now) in due]
+    skipped = len(events) - len(included)
 
     if skipped > 0:
         log.info("smart_poll_filtered", included=len(included), skipped=skipped)
@@ -10,8 +10,9 @@ from sharp_seeker.db.repository import Repository
 from sharp_seeker.config import Settings
 
 
-@pytest.fixture
-def settings() -> Settings:
+@pytest.fixture(scope="session")
+def _base_settings() -> Settings:
+    # Building Settings reads the environment and .env (~2.5 ms), so do it once
     return Settings(
         odds_api_key="test_key",
         discord_webhook_url="https://discord.com/api/webhooks/test/test",
@@ -19,6 +20,12 @@ def settings() -> Settings:
     )
 
 
+@pytest.fixture
+def settings(_base_settings) -> Settings:
+    # Tests override fields freely; a deep copy keeps that from leaking
+    return _base_settings.model_copy(deep=True)
+
+
 @pytest.fixture
 async def db():
     conn = await aiosqlite.connect(":memory:")
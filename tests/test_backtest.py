@@ -7,6 +7,15 @@ import pytest
 from sharp_seeker.analysis.backtest import Backtester
 
 
+# Fields every snapshot in this module shares
+_SNAP_BASE = {
+    "home_team": "Lakers",
+    "away_team": "Celtics",
+    "commence_time": "2099-01-15T00:00:00Z",
+    "deep_link": None,
+}
+
+
 def _snap(
     event_id: str,
     bookmaker: str,
@@ -18,17 +27,14 @@ def _snap(
     sport: str = "basketball_nba",
 ) -> dict:
     return {
+        **_SNAP_BASE,
         "event_id": event_id,
         "sport_key": sport,
-        "home_team": "Lakers",
-        "away_team": "Celtics",
-        "commence_time": "2099-01-15T00:00:00Z",
         "bookmaker_key": bookmaker,
         "market_key": market,
         "outcome_name": outcome,
         "price": price,
         "point": point,
-        "deep_link": None,
         "fetched_at": fetched_at,
     }
 
@@ -97,3 +103,26 @@ async def test_backtest_summary_output(settings, repo):
     assert "Backtest:" in summary
     assert "Fetch cycles:" in summary
     assert "Total signals:" in summary
+
+
+@pytest.mark.asyncio
+async def test_cycle_event_ids_match_per_cycle_queries(settings, repo):
+    """The one-query cycle listing equals fetch times plus per-cycle event IDs."""
+    t1 = "2025-01-15T12:00:00+00:00"
+    t2 = "2025-01-15T12:20:00+00:00"
+    await repo.insert_snapshots([
+        _snap("evt_b", "fanduel", "h2h", "Lakers", -110, None, t1),
+        _snap("evt_a", "fanduel", "h2h", "Lakers", -110, None, t1),
+        _snap("evt_a", "draftkings", "h2h", "Lakers", -115, None, t1),
+        _snap("evt_c", "fanduel", "h2h", "Lakers", -120, None, t2),
+    ])
+    start, end = "2025-01-15T00:00:00", "2025-01-16T00:00:00"
+
+    cycles = await repo.get_cycle_event_ids(start, end)
+
+    expected = [
+        (t, await repo.get_distinct_event_ids_at(t))
+        for t in await repo.get_distinct_fetch_times(start, end)
+    ]
+    assert cycles == expected
+    assert cycles[0] == (t1, ["evt_a", "evt_b"])
@@ -37,3 +37,17 @@ async def test_should_poll_exhausted(settings, repo):
     await repo.record_api_usage("/sports/nba/odds", 495, 5)
     tracker = BudgetTracker(settings, repo)
     assert await tracker.should_poll() is False
+
+
+@pytest.mark.asyncio
+async def test_remaining_cached_until_invalidated(settings, repo):
+    """Credits remaining is read once per TTL; invalidate() forces a re-read."""
+    await repo.record_api_usage("/sports/nba/odds", 9, 400)
+    tracker = BudgetTracker(settings, repo)
+    assert (await tracker.get_status())["credits_remaining"] == 400
+
+    await repo.record_api_usage("/sports/nba/odds", 9, 391)
+    assert (await tracker.get_status())["credits_remaining"] == 400
+
+    tracker.invalidate()
+    assert (await tracker.get_status())["credits_remaining"] == 391
@@ -11,6 +11,16 @@ from sharp_seeker.engine.exchange_monitor import (
 )
 
 
+# Fields every snapshot in this module shares
+_SNAP_BASE = {
+    "sport_key": "basketball_nba",
+    "home_team": "Lakers",
+    "away_team": "Celtics",
+    "commence_time": "2025-01-15T00:00:00Z",
+    "deep_link": None,
+}
+
+
 def _snap(
     event_id: str,
     bookmaker: str,
@@ -21,17 +31,13 @@ def _snap(
     fetched_at: str,
 ) -> dict:
     return {
+        **_SNAP_BASE,
         "event_id": event_id,
-        "sport_key": "basketball_nba",
-        "home_team": "Lakers",
-        "away_team": "Celtics",
-        "commence_time": "2025-01-15T00:00:00Z",
         "bookmaker_key": bookmaker,
         "market_key": market,
         "outcome_name": outcome,
         "price": price,
         "point": point,
-        "deep_link": None,
         "fetched_at": fetched_at,
     }
 
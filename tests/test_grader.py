@@ -361,3 +361,28 @@ class TestResolveAll:
         )
         row = await cursor.fetchone()
         assert row["result"] == "won"
+
+    @pytest.mark.asyncio
+    async def test_failed_sport_fetch_does_not_block_others(self, grader, repo):
+        """Score fetches run concurrently; one sport erroring keeps the rest."""
+        await repo.record_signal_result(
+            event_id="game1",
+            signal_type="steam_move",
+            market_key="h2h",
+            outcome_name="Los Angeles Lakers",
+            signal_direction="up",
+            signal_strength=0.8,
+            signal_at="2025-01-15T20:00:00",
+        )
+
+        async def fetch_scores(sport_key, days_from=1):
+            if sport_key == "basketball_nba":
+                return [GAME_LAKERS_WIN]
+            raise RuntimeError("boom")
+
+        grader._settings.sports = ["basketball_nba", "icehockey_nhl"]
+        grader._odds_client.fetch_scores = AsyncMock(side_effect=fetch_scores)
+
+        counts = await grader.resolve_all()
+        assert grader._odds_client.fetch_scores.await_count == 2
+        assert counts["resolved"] == 1
@@ -93,3 +93,37 @@ async def test_direction_extraction(settings, repo):
 
     unresolved = await repo.get_unresolved_signals()
     assert dict(unresolved[0])["signal_direction"] == "up"
+
+
+@pytest.mark.asyncio
+async def test_resolve_signals_bulk(settings, repo):
+    """resolve_signals should mark every given row in one call."""
+    tracker = PerformanceTracker(repo)
+    for i in range(3):
+        sig = _signal(event_id=f"evt_{i}")
+        await tracker.record_signals([sig], f"2025-01-15T12:{i:02d}:00+00:00")
+
+    unresolved = await repo.get_unresolved_signals()
+    keys = ("event_id", "signal_type", "market_key", "outcome_name", "signal_at")
+    await repo.resolve_signals([
+        {**{k: row[k] for k in keys}, "result": "won" if i < 2 else "lost"}
+        for i, row in enumerate(unresolved)
+    ])
+
+    assert await repo.get_unresolved_signals() == []
+    stats = await tracker.get_stats()
+    assert stats["steam_move"]["won"] == 2
+    assert stats["steam_move"]["lost"] == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_unresolved_signals_matches_list(settings, repo):
+    """The streaming read yields the same rows as get_unresolved_signals."""
+    tracker = PerformanceTracker(repo)
+    for i in range(3):
+        sig = _signal(event_id=f"evt_{i}")
+        await tracker.record_signals([sig], f"2025-01-15T12:{i:02d}:00+00:00")
+
+    streamed = [dict(row) async for row in repo.iter_unresolved_signals()]
+    assert streamed == [dict(row) for row in await repo.get_unresolved_signals()]
+    assert len(streamed) == 3
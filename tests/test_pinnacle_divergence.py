@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from sharp_seeker.engine.base import SignalType
 from sharp_seeker.engine.pinnacle_divergence import PinnacleDivergenceDetector
 
 
+# Fields every snapshot in this module shares
+_SNAP_BASE = {
+    "home_team": "Lakers",
+    "away_team": "Celtics",
+    "commence_time": "2025-01-15T00:00:00Z",
+    "deep_link": None,
+}
+
+
 def _snap(
     event_id: str,
     bookmaker: str,
@@ -19,17 +30,14 @@ def _snap(
     sport_key: str = "basketball_nba",
 ) -> dict:
     return {
+        **_SNAP_BASE,
         "event_id": event_id,
         "sport_key": sport_key,
-        "home_team": "Lakers",
-        "away_team": "Celtics",
-        "commence_time": "2025-01-15T00:00:00Z",
         "bookmaker_key": bookmaker,
         "market_key": market,
         "outcome_name": outcome,
         "price": price,
         "point": point,
-        "deep_link": None,
         "fetched_at": fetched_at,
     }
 
@@ -233,6 +241,25 @@ async def test_no_signal_without_pinnacle(settings, repo):
     assert len(signals) == 0
 
 
+@pytest.mark.asyncio
+async def test_no_pinnacle_skips_direction_lookup(settings, repo):
+    """Without a Pinnacle line the detector returns before any window read."""
+    event = "evt_pin4b"
+    t = "2025-01-15T12:00:00+00:00"
+
+    await repo.insert_snapshots([
+        _snap(event, "draftkings", "h2h", "Lakers", -110, None, t),
+        _snap(event, "fanduel", "h2h", "Lakers", 120, None, t),
+    ])
+
+    detector = PinnacleDivergenceDetector(settings, repo)
+    with patch.object(repo, "get_window_endpoints", wraps=repo.get_window_endpoints) as spy:
+        signals = await detector.detect(event, t)
+
+    assert signals == []
+    spy.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_sport_ml_prob_override(settings, repo):
     """Sport-specific ML threshold should override global.
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from unittest.mock import patch
 
 import pytest
@@ -16,6 +17,16 @@ from sharp_seeker.engine.pipeline import (
 from unittest.mock import AsyncMock, MagicMock
 
 
+# Fields every snapshot in this module shares
+_SNAP_BASE = {
+    "sport_key": "basketball_nba",
+    "home_team": "Lakers",
+    "away_team": "Celtics",
+    "commence_time": "2099-01-15T00:00:00Z",
+    "deep_link": None,
+}
+
+
 def _snap(
     event_id: str,
     bookmaker: str,
@@ -26,17 +37,13 @@ def _snap(
     fetched_at: str,
 ) -> dict:
     return {
+        **_SNAP_BASE,
         "event_id": event_id,
-        "sport_key": "basketball_nba",
-        "home_team": "Lakers",
-        "away_team": "Celtics",
-        "commence_time": "2099-01-15T00:00:00Z",
         "bookmaker_key": bookmaker,
         "market_key": market,
         "outcome_name": outcome,
         "price": price,
         "point": point,
-        "deep_link": None,
         "fetched_at": fetched_at,
     }
 
@@ -110,31 +117,34 @@ async def test_thin_arb_survives_strength_filter(settings, repo):
     assert arbs[0].details["profit_pct"] > 0
 
 
+# Both sides of a spread that trigger a steam move: three books move Lakers
+# from -3.5 to -4.0 AND Celtics from +3.5 to +4.0. BetRivers stays on the old
+# line = value book. Static, so built once at import.
+_MARKET_SIDE_T1 = "2025-01-15T12:00:00+00:00"
+_MARKET_SIDE_T2 = "2025-01-15T12:20:00+00:00"
+_MARKET_SIDE_SNAPS = (
+    *(
+        _snap("evt_sides", bm, "spreads", outcome, -110, point, t)
+        for bm in ("draftkings", "fanduel", "betmgm")
+        for outcome, point, t in (
+            ("Lakers", -3.5, _MARKET_SIDE_T1),
+            ("Lakers", -4.0, _MARKET_SIDE_T2),
+            ("Celtics", 3.5, _MARKET_SIDE_T1),
+            ("Celtics", 4.0, _MARKET_SIDE_T2),
+        )
+    ),
+    _snap("evt_sides", "betrivers", "spreads", "Lakers", -110, -3.5, _MARKET_SIDE_T1),
+    _snap("evt_sides", "betrivers", "spreads", "Lakers", -110, -3.5, _MARKET_SIDE_T2),
+    _snap("evt_sides", "betrivers", "spreads", "Celtics", -110, 3.5, _MARKET_SIDE_T1),
+    _snap("evt_sides", "betrivers", "spreads", "Celtics", -110, 3.5, _MARKET_SIDE_T2),
+)
+
+
 @pytest.mark.asyncio
 async def test_market_side_dedup(settings, repo):
     """Both sides of the same market should be deduped to one signal."""
-    event = "evt_sides"
-    t1 = "2025-01-15T12:00:00+00:00"
-    t2 = "2025-01-15T12:20:00+00:00"
-
-    # Create data for BOTH sides of a spread that trigger a steam move.
-    # Three books all move Lakers from -3.5 to -4.0 AND Celtics from +3.5 to +4.0.
-    # Caesars stays on old line = value book.
-    snapshots = []
-    for bm in ("draftkings", "fanduel", "betmgm"):
-        # Lakers side
-        snapshots.append(_snap(event, bm, "spreads", "Lakers", -110, -3.5, t1))
-        snapshots.append(_snap(event, bm, "spreads", "Lakers", -110, -4.0, t2))
-        # Celtics side (mirror)
-        snapshots.append(_snap(event, bm, "spreads", "Celtics", -110, 3.5, t1))
-        snapshots.append(_snap(event, bm, "spreads", "Celtics", -110, 4.0, t2))
-    # Caesars doesn't move (stale line)
-    snapshots.append(_snap(event, "betrivers", "spreads", "Lakers", -110, -3.5, t1))
-    snapshots.append(_snap(event, "betrivers", "spreads", "Lakers", -110, -3.5, t2))
-    snapshots.append(_snap(event, "betrivers", "spreads", "Celtics", -110, 3.5, t1))
-    snapshots.append(_snap(event, "betrivers", "spreads", "Celtics", -110, 3.5, t2))
-
-    await repo.insert_snapshots(snapshots)
+    t2 = _MARKET_SIDE_T2
+    await repo.insert_snapshots(_MARKET_SIDE_SNAPS)
 
     pipeline = DetectionPipeline(settings, repo)
     signals = await pipeline.run(t2)
@@ -195,6 +205,20 @@ async def test_mirror_side_suppressed_by_cooldown(settings, repo):
     )
 
 
+# Fields every test signal shares; _make_signal varies the rest
+_BASE_SIGNAL = Signal(
+    signal_type=SignalType.STEAM_MOVE,
+    event_id="evt1",
+    sport_key="basketball_nba",
+    home_team="Team A",
+    away_team="Team B",
+    market_key="spreads",
+    outcome_name="Team A",
+    strength=0.7,
+    description="test",
+)
+
+
 def _make_signal(
     signal_type: SignalType,
     outcome: str = "Team A",
@@ -203,172 +227,112 @@ def _make_signal(
     details: dict | None = None,
     sport_key: str = "basketball_nba",
 ) -> Signal:
-    return Signal(
+    return replace(
+        _BASE_SIGNAL,
         signal_type=signal_type,
-        event_id="evt1",
         sport_key=sport_key,
-        home_team="Team A",
-        away_team="Team B",
         market_key=market,
         outcome_name=outcome,
         strength=strength,
-        description="test",
         details=details or {},
     )
 
 
-def test_pick_best_reverse_line_follows_pinnacle():
-    """Reverse line: keep the side where Pinnacle delta is positive."""
-    sigs = [
-        _make_signal(
-            SignalType.REVERSE_LINE,
-            outcome="Team A",
-            details={"pinnacle_delta": -0.5, "value_books": [{"bookmaker": "dk"}]},
-        ),
-        _make_signal(
-            SignalType.REVERSE_LINE,
-            outcome="Team B",
-            details={"pinnacle_delta": 0.5, "value_books": [{"bookmaker": "dk"}]},
-        ),
-    ]
-    best = _pick_best_signal(sigs)
-    assert best.outcome_name == "Team B"
-
-
-def test_pick_best_steam_spread_prefers_down():
-    """Steam move on spreads: keep the side where direction is 'down'."""
-    sigs = [
-        _make_signal(
-            SignalType.STEAM_MOVE,
-            outcome="Lakers",
-            market="spreads",
-            details={"direction": "down", "value_books": []},
-        ),
-        _make_signal(
-            SignalType.STEAM_MOVE,
-            outcome="Celtics",
-            market="spreads",
-            details={"direction": "up", "value_books": []},
-        ),
-    ]
-    best = _pick_best_signal(sigs)
-    assert best.outcome_name == "Lakers"
-
-
-def test_pick_best_steam_h2h_prefers_down():
-    """Steam move on h2h: keep the side where direction is 'down'."""
-    sigs = [
-        _make_signal(
-            SignalType.STEAM_MOVE,
-            outcome="Favorite",
-            market="h2h",
-            details={"direction": "down", "value_books": []},
-        ),
-        _make_signal(
-            SignalType.STEAM_MOVE,
-            outcome="Underdog",
-            market="h2h",
-            details={"direction": "up", "value_books": []},
-        ),
-    ]
-    best = _pick_best_signal(sigs)
-    assert best.outcome_name == "Favorite"
-
-
-def test_pick_best_steam_totals_over():
-    """Steam move on totals going up: keep the Over side."""
-    sigs = [
-        _make_signal(
-            SignalType.STEAM_MOVE,
-            outcome="Over",
-            market="totals",
-            details={"direction": "up", "value_books": []},
-        ),
-        _make_signal(
-            SignalType.STEAM_MOVE,
-            outcome="Under",
-            market="totals",
-            details={"direction": "up", "value_books": []},
-        ),
-    ]
-    best = _pick_best_signal(sigs)
-    assert best.outcome_name == "Over"
-
-
-def test_pick_best_steam_totals_under():
-    """Steam move on totals going down: keep the Under side."""
-    sigs = [
-        _make_signal(
-            SignalType.STEAM_MOVE,
-            outcome="Over",
-            market="totals",
-            details={"direction": "down", "value_books": []},
-        ),
-        _make_signal(
-            SignalType.STEAM_MOVE,
-            outcome="Under",
-            market="totals",
-            details={"direction": "down", "value_books": []},
-        ),
-    ]
-    best = _pick_best_signal(sigs)
-    assert best.outcome_name == "Under"
-
-
-def test_pick_best_exchange_prefers_shortened():
-    """Exchange shift: keep the side that shortened."""
-    sigs = [
-        _make_signal(
-            SignalType.EXCHANGE_SHIFT,
-            outcome="Team A",
-            market="h2h",
-            details={"direction": "shortened", "value_books": []},
-        ),
-        _make_signal(
-            SignalType.EXCHANGE_SHIFT,
-            outcome="Team B",
-            market="h2h",
-            details={"direction": "drifted", "value_books": []},
-        ),
-    ]
-    best = _pick_best_signal(sigs)
-    assert best.outcome_name == "Team A"
-
-
-def test_pick_best_rapid_change_prefers_larger_delta():
-    """Rapid change: keep the side with the larger delta."""
-    sigs = [
-        _make_signal(
-            SignalType.RAPID_CHANGE,
-            outcome="Team A",
-            details={"delta": 0.5, "value_books": []},
-        ),
-        _make_signal(
-            SignalType.RAPID_CHANGE,
-            outcome="Team B",
-            details={"delta": 1.2, "value_books": []},
-        ),
-    ]
-    best = _pick_best_signal(sigs)
-    assert best.outcome_name == "Team B"
-
-
-def test_pick_best_fallback_uses_value_books():
-    """When no signal-specific logic matches, prefer more value books."""
+# Two-sided _pick_best_signal cases: (signal type, market, [(outcome, details)
+# per side], outcome expected to win). Each id names the rule under test.
+PICK_BEST_CASES = [
+    # Reverse line: keep the side where Pinnacle delta is positive
+    pytest.param(
+        SignalType.REVERSE_LINE, "spreads",
+        [
+            ("Team A", {"pinnacle_delta": -0.5, "value_books": [{"bookmaker": "dk"}]}),
+            ("Team B", {"pinnacle_delta": 0.5, "value_books": [{"bookmaker": "dk"}]}),
+        ],
+        "Team B",
+        id="reverse_line_follows_pinnacle",
+    ),
+    # Steam move on spreads: keep the side where direction is 'down'
+    pytest.param(
+        SignalType.STEAM_MOVE, "spreads",
+        [
+            ("Lakers", {"direction": "down", "value_books": []}),
+            ("Celtics", {"direction": "up", "value_books": []}),
+        ],
+        "Lakers",
+        id="steam_spread_prefers_down",
+    ),
+    # Steam move on h2h: keep the side where direction is 'down'
+    pytest.param(
+        SignalType.STEAM_MOVE, "h2h",
+        [
+            ("Favorite", {"direction": "down", "value_books": []}),
+            ("Underdog", {"direction": "up", "value_books": []}),
+        ],
+        "Favorite",
+        id="steam_h2h_prefers_down",
+    ),
+    # Steam move on totals going up: keep the Over side
+    pytest.param(
+        SignalType.STEAM_MOVE, "totals",
+        [
+            ("Over", {"direction": "up", "value_books": []}),
+            ("Under", {"direction": "up", "value_books": []}),
+        ],
+        "Over",
+        id="steam_totals_over",
+    ),
+    # Steam move on totals going down: keep the Under side
+    pytest.param(
+        SignalType.STEAM_MOVE, "totals",
+        [
+            ("Over", {"direction": "down", "value_books": []}),
+            ("Under", {"direction": "down", "value_books": []}),
+        ],
+        "Under",
+        id="steam_totals_under",
+    ),
+    # Exchange shift: keep the side that shortened
+    pytest.param(
+        SignalType.EXCHANGE_SHIFT, "h2h",
+        [
+            ("Team A", {"direction": "shortened", "value_books": []}),
+            ("Team B", {"direction": "drifted", "value_books": []}),
+        ],
+        "Team A",
+        id="exchange_prefers_shortened",
+    ),
+    # Rapid change: keep the side with the larger delta
+    pytest.param(
+        SignalType.RAPID_CHANGE, "spreads",
+        [
+            ("Team A", {"delta": 0.5, "value_books": []}),
+            ("Team B", {"delta": 1.2, "value_books": []}),
+        ],
+        "Team B",
+        id="rapid_change_prefers_larger_delta",
+    ),
+    # No signal-specific rule matches: prefer more value books
+    pytest.param(
+        SignalType.PINNACLE_DIVERGENCE, "spreads",
+        [
+            ("Team A", {"value_books": [{"bookmaker": "dk"}]}),
+            ("Team B", {"value_books": [{"bookmaker": "dk"}, {"bookmaker": "fd"}]}),
+        ],
+        "Team B",
+        id="fallback_uses_value_books",
+    ),
+]
+
+
+@pytest.mark.parametrize("signal_type,market,sides,expected", PICK_BEST_CASES)
+def test_pick_best(signal_type, market, sides, expected):
+    """_pick_best_signal keeps the side each signal type's rule favors."""
     sigs = [
-        _make_signal(
-            SignalType.PINNACLE_DIVERGENCE,
-            outcome="Team A",
-            details={"value_books": [{"bookmaker": "dk"}]},
-        ),
-        _make_signal(
-            SignalType.PINNACLE_DIVERGENCE,
-            outcome="Team B",
-            details={"value_books": [{"bookmaker": "dk"}, {"bookmaker": "fd"}]},
-        ),
+        _make_signal(signal_type, outcome=outcome, market=market, details=details)
+        for outcome, details in sides
     ]
     best = _pick_best_signal(sigs)
-    assert best.outcome_name == "Team B"
+    assert best.outcome_name == expected
 
 
 def test_pick_best_pd_prefers_better_price_at_same_number():
@@ -867,3 +831,125 @@ async def test_blocklist_empty(repo):
     signals = await pipeline.run(t2)
     steam = [s for s in signals if s.signal_type == SignalType.STEAM_MOVE]
     assert len(steam) > 0, "Signals should pass with empty blocklist"
+
+
+@pytest.mark.asyncio
+async def test_detectors_share_latest_snapshot_read(settings, repo):
+    """All detectors reuse one get_latest_snapshots read per event within a run."""
+    event = "evt_cache"
+    t1 = "2025-01-15T12:00:00+00:00"
+    t2 = "2025-01-15T12:20:00+00:00"
+    await repo.insert_snapshots([
+        _snap(event, "pinnacle", "spreads", "Lakers", -110, -3.5, t1),
+        _snap(event, "pinnacle", "spreads", "Lakers", -110, -4.0, t2),
+        _snap(event, "draftkings", "spreads", "Lakers", -110, -3.5, t2),
+    ])
+
+    pipeline = DetectionPipeline(settings, repo)
+    with patch.object(
+        repo, "get_latest_snapshots", wraps=repo.get_latest_snapshots
+    ) as spy:
+        await pipeline.run(t2)
+
+    spy.assert_awaited_once_with(event)
+
+
+@pytest.mark.asyncio
+async def test_pinnacle_moved_event_ids(settings, repo):
+    """Only events whose Pinnacle line changed since the previous fetch are reported."""
+    t1 = "2025-01-15T12:00:00+00:00"
+    t2 = "2025-01-15T12:20:00+00:00"
+    await repo.insert_snapshots([
+        _snap("evt_moved", "pinnacle", "spreads", "Lakers", -110, -3.5, t1),
+        _snap("evt_moved", "pinnacle", "spreads", "Lakers", -110, -4.0, t2),
+        _snap("evt_quiet", "pinnacle", "spreads", "Lakers", -110, -3.5, t1),
+        _snap("evt_quiet", "pinnacle", "spreads", "Lakers", -110, -3.5, t2),
+        _snap("evt_quiet", "draftkings", "spreads", "Lakers", -110, -3.5, t1),
+        _snap("evt_quiet", "draftkings", "spreads", "Lakers", -110, -5.0, t2),
+    ])
+
+    assert await repo.get_pinnacle_moved_event_ids(t2) == {"evt_moved"}
+
+
+@pytest.mark.asyncio
+async def test_detectors_share_window_endpoints_read(settings, repo):
+    """Steam, RLM and the Pinnacle trend share one window-endpoints read per event."""
+    event = "evt_window"
+    t1 = "2025-01-15T12:00:00+00:00"
+    t2 = "2025-01-15T12:20:00+00:00"
+    await repo.insert_snapshots([
+        _snap(event, "pinnacle", "spreads", "Lakers", -110, -3.5, t1),
+        _snap(event, "pinnacle", "spreads", "Lakers", -110, -4.0, t2),
+        _snap(event, "draftkings", "spreads", "Lakers", -110, -3.5, t2),
+    ])
+
+    pipeline = DetectionPipeline(settings, repo)
+    with patch.object(
+        repo, "get_window_endpoints", wraps=repo.get_window_endpoints
+    ) as spy:
+        await pipeline.run(t2)
+
+    spy.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_latest_by_side_built_once_per_event(settings, repo):
+    """The (market, outcome) index is built once and shared across callers."""
+    from sharp_seeker.engine.base import RequestCache
+
+    event = "evt_side"
+    t = "2025-01-15T12:00:00+00:00"
+    await repo.insert_snapshots([
+        _snap(event, "pinnacle", "h2h", "Lakers", -150, None, t),
+        _snap(event, "betfair_ex_eu", "h2h", "Lakers", -145, None, t),
+        _snap(event, "draftkings", "h2h", "Lakers", -140, None, t),
+    ])
+
+    cache = RequestCache()
+    first = await cache.latest_by_side(repo, event)
+    second = await cache.latest_by_side(repo, event)
+
+    assert first is second
+    assert list(first[("h2h", "Lakers")]) == ["pinnacle", "betfair_ex_eu", "draftkings"]
+
+
+@pytest.mark.asyncio
+async def test_previous_snapshots_at_matches_per_event(settings, repo):
+    """The cycle-wide previous-snapshot read equals the per-event query for each event."""
+    t1 = "2025-01-15T12:00:00+00:00"
+    t2 = "2025-01-15T12:10:00+00:00"
+    t3 = "2025-01-15T12:20:00+00:00"
+    await repo.insert_snapshots([
+        _snap("evt_a", "pinnacle", "spreads", "Lakers", -110, -3.5, t1),
+        _snap("evt_a", "pinnacle", "spreads", "Lakers", -110, -4.0, t2),
+        _snap("evt_a", "draftkings", "spreads", "Lakers", -110, -3.5, t1),
+        _snap("evt_a", "pinnacle", "spreads", "Lakers", -110, -4.5, t3),
+        _snap("evt_b", "fanduel", "h2h", "Celtics", 120, None, t2),
+        _snap("evt_b", "fanduel", "h2h", "Celtics", 125, None, t3),
+        _snap("evt_c", "fanduel", "h2h", "Celtics", 125, None, t3),
+    ])
+
+    by_event = await repo.get_previous_snapshots_at(t3)
+
+    assert set(by_event) == {"evt_a", "evt_b"}
+    for event_id, rows in by_event.items():
+        expected = await repo.get_previous_snapshots(event_id, t3)
+        assert sorted(r["id"] for r in rows) == sorted(r["id"] for r in expected)
+
+
+@pytest.mark.asyncio
+async def test_insert_snapshots_accepts_snapshot_tuples(settings, repo):
+    """Snapshot tuples and dict rows insert the same columns."""
+    from sharp_seeker.db.models import Snapshot
+
+    t1 = "2025-01-15T12:00:00+00:00"
+    as_dict = _snap("evt_a", "fanduel", "spreads", "Lakers", -110, -3.5, t1)
+    as_tuple = Snapshot(**{**as_dict, "bookmaker_key": "draftkings"})
+
+    assert await repo.insert_snapshots([as_dict, as_tuple]) == 2
+
+    rows = await repo.get_latest_snapshots("evt_a")
+    by_book = {r["bookmaker_key"]: dict(r) for r in rows}
+    for key in Snapshot._fields:
+        if key != "bookmaker_key":
+            assert by_book["fanduel"][key] == by_book["draftkings"][key]
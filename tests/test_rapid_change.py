@@ -8,6 +8,16 @@ from sharp_seeker.engine.base import SignalType
 from sharp_seeker.engine.rapid_change import RapidChangeDetector
 
 
+# Fields every snapshot in this module shares
+_SNAP_BASE = {
+    "sport_key": "americanfootball_nfl",
+    "home_team": "Chiefs",
+    "away_team": "Bills",
+    "commence_time": "2025-01-20T00:00:00Z",
+    "deep_link": None,
+}
+
+
 def _snap(
     event_id: str,
     bookmaker: str,
@@ -18,17 +28,13 @@ def _snap(
     fetched_at: str,
 ) -> dict:
     return {
+        **_SNAP_BASE,
         "event_id": event_id,
-        "sport_key": "americanfootball_nfl",
-        "home_team": "Chiefs",
-        "away_team": "Bills",
-        "commence_time": "2025-01-20T00:00:00Z",
         "bookmaker_key": bookmaker,
         "market_key": market,
         "outcome_name": outcome,
         "price": price,
         "point": point,
-        "deep_link": None,
         "fetched_at": fetched_at,
     }
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import csv
 import io
 import json
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
@@ -15,25 +16,42 @@ from sharp_seeker.analysis.reports import ReportGenerator
 from sharp_seeker.engine.base import Signal, SignalType
 
 
+# Fields every test signal shares; _signal varies the rest
+_BASE_SIGNAL = Signal(
+    signal_type=SignalType.STEAM_MOVE,
+    event_id="",
+    sport_key="basketball_nba",
+    home_team="Lakers",
+    away_team="Celtics",
+    market_key="spreads",
+    outcome_name="Lakers",
+    strength=0.7,
+    description="test",
+)
+
+
 def _signal(
     event_id: str,
     signal_type: SignalType,
     market_key: str = "spreads",
 ) -> Signal:
-    return Signal(
+    return replace(
+        _BASE_SIGNAL,
         signal_type=signal_type,
         event_id=event_id,
-        sport_key="basketball_nba",
-        home_team="Lakers",
-        away_team="Celtics",
         market_key=market_key,
-        outcome_name="Lakers",
-        strength=0.7,
-        description="test",
         details={"direction": "down"},
     )
 
 
+def _signal_key(row) -> dict:
+    """The columns resolve_signals matches a signal_results row on."""
+    return {
+        k: row[k]
+        for k in ("event_id", "signal_type", "market_key", "outcome_name", "signal_at")
+    }
+
+
 @pytest.mark.asyncio
 async def test_stats_multiple_types(settings, repo):
     """Stats should be grouped by signal type."""
@@ -51,12 +69,10 @@ async def test_stats_multiple_types(settings, repo):
     )
 
     # Resolve all
-    for row in await repo.get_unresolved_signals():
-        r = dict(row)
-        await repo.resolve_signal(
-            r["event_id"], r["signal_type"], r["market_key"],
-            r["outcome_name"], r["signal_at"], "won",
-        )
+    await repo.resolve_signals([
+        {**_signal_key(row), "result": "won"}
+        for row in await repo.get_unresolved_signals()
+    ])
 
     stats = await tracker.get_stats()
     assert stats["steam_move"]["won"] == 2
@@ -108,12 +124,10 @@ async def test_performance_stats_by_market(settings, repo):
     # Resolve with mixed results
     unresolved = await repo.get_unresolved_signals()
     results_map = {"e1": "won", "e2": "lost", "e3": "won", "e4": "push"}
-    for row in unresolved:
-        r = dict(row)
-        await repo.resolve_signal(
-            r["event_id"], r["signal_type"], r["market_key"],
-            r["outcome_name"], r["signal_at"], results_map[r["event_id"]],
-        )
+    await repo.resolve_signals([
+        {**_signal_key(row), "result": results_map[row["event_id"]]}
+        for row in unresolved
+    ])
 
     # All markets
     stats = await repo.get_performance_stats_by_market()
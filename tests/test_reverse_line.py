@@ -8,6 +8,16 @@ from sharp_seeker.engine.base import SignalType
 from sharp_seeker.engine.reverse_line import ReverseLineDetector
 
 
+# Fields every snapshot in this module shares
+_SNAP_BASE = {
+    "sport_key": "americanfootball_nfl",
+    "home_team": "Chiefs",
+    "away_team": "Bills",
+    "commence_time": "2025-01-20T00:00:00Z",
+    "deep_link": None,
+}
+
+
 def _snap(
     event_id: str,
     bookmaker: str,
@@ -18,44 +28,53 @@ def _snap(
     fetched_at: str,
 ) -> dict:
     return {
+        **_SNAP_BASE,
         "event_id": event_id,
-        "sport_key": "americanfootball_nfl",
-        "home_team": "Chiefs",
-        "away_team": "Bills",
-        "commence_time": "2025-01-20T00:00:00Z",
         "bookmaker_key": bookmaker,
         "market_key": market,
         "outcome_name": outcome,
         "price": price,
         "point": point,
-        "deep_link": None,
         "fetched_at": fetched_at,
     }
 
 
+_RLM_T1 = "2025-01-20T12:00:00+00:00"
+_RLM_T2 = "2025-01-20T12:20:00+00:00"
+
+# US books move the spread down while Pinnacle moves it up. Static, so built
+# once at import.
+_RLM_DETECT_SNAPS = (
+    # Time 1
+    _snap("evt_rlm1", "pinnacle", "spreads", "Chiefs", -110, -3.0, _RLM_T1),
+    _snap("evt_rlm1", "draftkings", "spreads", "Chiefs", -110, -3.0, _RLM_T1),
+    _snap("evt_rlm1", "fanduel", "spreads", "Chiefs", -110, -3.0, _RLM_T1),
+    _snap("evt_rlm1", "betmgm", "spreads", "Chiefs", -110, -3.0, _RLM_T1),
+    # Time 2: US books go down, Pinnacle goes up
+    _snap("evt_rlm1", "pinnacle", "spreads", "Chiefs", -110, -2.5, _RLM_T2),  # up (+0.5)
+    _snap("evt_rlm1", "draftkings", "spreads", "Chiefs", -110, -3.5, _RLM_T2),  # down (-0.5)
+    _snap("evt_rlm1", "fanduel", "spreads", "Chiefs", -110, -3.5, _RLM_T2),    # down (-0.5)
+    _snap("evt_rlm1", "betmgm", "spreads", "Chiefs", -110, -4.0, _RLM_T2),     # down (-1.0)
+)
+
+# US books and Pinnacle both move the spread down.
+_RLM_SAME_DIRECTION_SNAPS = (
+    _snap("evt_rlm2", "pinnacle", "spreads", "Chiefs", -110, -3.0, _RLM_T1),
+    _snap("evt_rlm2", "draftkings", "spreads", "Chiefs", -110, -3.0, _RLM_T1),
+    _snap("evt_rlm2", "fanduel", "spreads", "Chiefs", -110, -3.0, _RLM_T1),
+    _snap("evt_rlm2", "pinnacle", "spreads", "Chiefs", -110, -3.5, _RLM_T2),
+    _snap("evt_rlm2", "draftkings", "spreads", "Chiefs", -110, -3.5, _RLM_T2),
+    _snap("evt_rlm2", "fanduel", "spreads", "Chiefs", -110, -3.5, _RLM_T2),
+)
+
+
 @pytest.mark.asyncio
 async def test_reverse_line_detected(settings, repo):
     """US books move spread down but Pinnacle moves up → RLM signal."""
-    event = "evt_rlm1"
-    t1 = "2025-01-20T12:00:00+00:00"
-    t2 = "2025-01-20T12:20:00+00:00"
-
-    snapshots = [
-        # Time 1
-        _snap(event, "pinnacle", "spreads", "Chiefs", -110, -3.0, t1),
-        _snap(event, "draftkings", "spreads", "Chiefs", -110, -3.0, t1),
-        _snap(event, "fanduel", "spreads", "Chiefs", -110, -3.0, t1),
-        _snap(event, "betmgm", "spreads", "Chiefs", -110, -3.0, t1),
-        # Time 2: US books go down, Pinnacle goes up
-        _snap(event, "pinnacle", "spreads", "Chiefs", -110, -2.5, t2),  # up (+0.5)
-        _snap(event, "draftkings", "spreads", "Chiefs", -110, -3.5, t2),  # down (-0.5)
-        _snap(event, "fanduel", "spreads", "Chiefs", -110, -3.5, t2),    # down (-0.5)
-        _snap(event, "betmgm", "spreads", "Chiefs", -110, -4.0, t2),     # down (-1.0)
-    ]
-    await repo.insert_snapshots(snapshots)
+    await repo.insert_snapshots(_RLM_DETECT_SNAPS)
 
     detector = ReverseLineDetector(settings, repo)
-    signals = await detector.detect(event, t2)
+    signals = await detector.detect("evt_rlm1", _RLM_T2)
 
     assert len(signals) == 1
     sig = signals[0]
@@ -67,21 +86,45 @@ async def test_reverse_line_detected(settings, repo):
 @pytest.mark.asyncio
 async def test_no_rlm_same_direction(settings, repo):
     """If US and Pinnacle move the same direction, no RLM signal."""
-    event = "evt_rlm2"
+    await repo.insert_snapshots(_RLM_SAME_DIRECTION_SNAPS)
+
+    detector = ReverseLineDetector(settings, repo)
+    signals = await detector.detect("evt_rlm2", _RLM_T2)
+
+    assert len(signals) == 0
+
+
+@pytest.mark.asyncio
+async def test_rlm_uses_window_endpoints(settings, repo):
+    """Only the first and last snapshot per book count — intermediate noise is ignored."""
+    event = "evt_rlm3"
     t1 = "2025-01-20T12:00:00+00:00"
-    t2 = "2025-01-20T12:20:00+00:00"
+    t2 = "2025-01-20T12:10:00+00:00"
+    t3 = "2025-01-20T12:20:00+00:00"
 
     snapshots = [
         _snap(event, "pinnacle", "spreads", "Chiefs", -110, -3.0, t1),
         _snap(event, "draftkings", "spreads", "Chiefs", -110, -3.0, t1),
         _snap(event, "fanduel", "spreads", "Chiefs", -110, -3.0, t1),
+        # Mid-window: Pinnacle briefly dips, US books briefly rise
         _snap(event, "pinnacle", "spreads", "Chiefs", -110, -3.5, t2),
-        _snap(event, "draftkings", "spreads", "Chiefs", -110, -3.5, t2),
-        _snap(event, "fanduel", "spreads", "Chiefs", -110, -3.5, t2),
+        _snap(event, "draftkings", "spreads", "Chiefs", -110, -2.0, t2),
+        _snap(event, "fanduel", "spreads", "Chiefs", -110, -2.0, t2),
+        # End of window: Pinnacle up, US books down (net RLM)
+        _snap(event, "pinnacle", "spreads", "Chiefs", -110, -2.5, t3),
+        _snap(event, "draftkings", "spreads", "Chiefs", -110, -3.5, t3),
+        _snap(event, "fanduel", "spreads", "Chiefs", -110, -3.5, t3),
     ]
     await repo.insert_snapshots(snapshots)
 
+    endpoints = await repo.get_window_endpoints(event, t1)
+    assert len(endpoints) == 3
+    pin = next(ep for ep in endpoints if ep["bookmaker_key"] == "pinnacle")
+    assert (pin["first_point"], pin["last_point"], pin["n"]) == (-3.0, -2.5, 3)
+
     detector = ReverseLineDetector(settings, repo)
-    signals = await detector.detect(event, t2)
+    signals = await detector.detect(event, t3)
 
-    assert len(signals) == 0
+    assert len(signals) == 1
+    assert signals[0].details["pinnacle_delta"] == 0.5
+    assert signals[0].details["us_movers"] == ["draftkings", "fanduel"]
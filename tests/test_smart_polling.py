@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 import pytest
 
@@ -13,15 +14,25 @@ from sharp_seeker.polling.smart import (
     filter_events_for_cycle,
 )
 
+# Read the clock once; the cases sit hours away from any priority boundary,
+# so drift over a test run can't move an event between buckets.
+_NOW = datetime.now(timezone.utc)
+
+
+@lru_cache(maxsize=None)
+def _commence_iso(hours_from_now: float) -> str:
+    """Commence time ``hours_from_now`` past _NOW; the suite only uses a handful."""
+    return (_NOW + timedelta(hours=hours_from_now)).isoformat()
+
 
 def _event(hours_from_now: float) -> EventOddsSchema:
-    commence = datetime.now(timezone.utc) + timedelta(hours=hours_from_now)
-    return EventOddsSchema(
+    # Fields are known-good; these tests exercise polling logic, not validation
+    return EventOddsSchema.model_construct(
         id="test_event",
         sport_key="basketball_nba",
         home_team="Lakers",
         away_team="Celtics",
-        commence_time=commence.isoformat(),
+        commence_time=_commence_iso(hours_from_now),
         bookmakers=[],
     )
 
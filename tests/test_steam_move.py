@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
+from sharp_seeker.db.models import Snapshot
 from sharp_seeker.engine.base import SignalType
 from sharp_seeker.engine.steam_move import SteamMoveDetector
 
@@ -16,103 +19,102 @@ def _snap(
     price: float,
     point: float | None,
     fetched_at: str,
-) -> dict:
-    return {
-        "event_id": event_id,
-        "sport_key": "basketball_nba",
-        "home_team": "Lakers",
-        "away_team": "Celtics",
-        "commence_time": "2025-01-15T00:00:00Z",
-        "bookmaker_key": bookmaker,
-        "market_key": market,
-        "outcome_name": outcome,
-        "price": price,
-        "point": point,
-        "deep_link": None,
-        "fetched_at": fetched_at,
-    }
+) -> Snapshot:
+    return Snapshot(
+        event_id=event_id,
+        sport_key="basketball_nba",
+        home_team="Lakers",
+        away_team="Celtics",
+        commence_time="2025-01-15T00:00:00Z",
+        bookmaker_key=bookmaker,
+        market_key=market,
+        outcome_name=outcome,
+        price=price,
+        point=point,
+        deep_link=None,
+        fetched_at=fetched_at,
+    )
+
+
+@pytest.fixture
+def detector(settings, repo) -> SteamMoveDetector:
+    return SteamMoveDetector(settings, repo)
+
+
+# fetched_at is stored as ISO text and compared as text, so the window
+# endpoints stay strings; defined once and shared by every test here.
+_T1 = "2025-01-15T12:00:00+00:00"
+_T2 = "2025-01-15T12:20:00+00:00"
+
+# (snapshots, expected direction or None for no signal). Every case inserts
+# its rows in one batch and checks the event's detection at _T2.
+STEAM_CASES = [
+    # 3 books moving a spread in the same direction triggers a steam move
+    pytest.param(
+        [
+            # Time 1: all books have Lakers -3.5
+            _snap("evt1", "draftkings", "spreads", "Lakers", -110, -3.5, _T1),
+            _snap("evt1", "fanduel", "spreads", "Lakers", -110, -3.5, _T1),
+            _snap("evt1", "betmgm", "spreads", "Lakers", -110, -3.5, _T1),
+            _snap("evt1", "betrivers", "spreads", "Lakers", -110, -3.5, _T1),
+            # Time 2: 3 books move to -4.0
+            _snap("evt1", "draftkings", "spreads", "Lakers", -110, -4.0, _T2),
+            _snap("evt1", "fanduel", "spreads", "Lakers", -110, -4.0, _T2),
+            _snap("evt1", "betmgm", "spreads", "Lakers", -110, -4.0, _T2),
+            _snap("evt1", "betrivers", "spreads", "Lakers", -110, -3.5, _T2),  # didn't move
+        ],
+        "down",  # -3.5 → -4.0 is negative delta
+        id="spread_detected",
+    ),
+    # Only 2 books moving should not trigger with min_books=3
+    pytest.param(
+        [
+            _snap("evt2", "draftkings", "spreads", "Lakers", -110, -3.5, _T1),
+            _snap("evt2", "fanduel", "spreads", "Lakers", -110, -3.5, _T1),
+            _snap("evt2", "betmgm", "spreads", "Lakers", -110, -3.5, _T1),
+            _snap("evt2", "draftkings", "spreads", "Lakers", -110, -4.0, _T2),
+            _snap("evt2", "fanduel", "spreads", "Lakers", -110, -4.0, _T2),
+            _snap("evt2", "betmgm", "spreads", "Lakers", -110, -3.5, _T2),  # didn't move
+        ],
+        None,
+        id="below_threshold",
+    ),
+    # Steam move on h2h market uses price delta
+    pytest.param(
+        [
+            _snap("evt3", "draftkings", "h2h", "Lakers", -150, None, _T1),
+            _snap("evt3", "fanduel", "h2h", "Lakers", -150, None, _T1),
+            _snap("evt3", "betmgm", "h2h", "Lakers", -150, None, _T1),
+            _snap("evt3", "draftkings", "h2h", "Lakers", -170, None, _T2),
+            _snap("evt3", "fanduel", "h2h", "Lakers", -175, None, _T2),
+            _snap("evt3", "betmgm", "h2h", "Lakers", -165, None, _T2),
+        ],
+        "down",
+        id="moneyline",
+    ),
+]
 
 
 @pytest.mark.asyncio
-async def test_steam_move_detected(settings, repo):
-    """3 books moving a spread in the same direction triggers a steam move."""
-    event = "evt1"
-    t1 = "2025-01-15T12:00:00+00:00"
-    t2 = "2025-01-15T12:20:00+00:00"
-
-    snapshots = [
-        # Time 1: all books have Lakers -3.5
-        _snap(event, "draftkings", "spreads", "Lakers", -110, -3.5, t1),
-        _snap(event, "fanduel", "spreads", "Lakers", -110, -3.5, t1),
-        _snap(event, "betmgm", "spreads", "Lakers", -110, -3.5, t1),
-        _snap(event, "betrivers", "spreads", "Lakers", -110, -3.5, t1),
-        # Time 2: 3 books move to -4.0
-        _snap(event, "draftkings", "spreads", "Lakers", -110, -4.0, t2),
-        _snap(event, "fanduel", "spreads", "Lakers", -110, -4.0, t2),
-        _snap(event, "betmgm", "spreads", "Lakers", -110, -4.0, t2),
-        _snap(event, "betrivers", "spreads", "Lakers", -110, -3.5, t2),  # didn't move
-    ]
+@pytest.mark.parametrize("snapshots,direction", STEAM_CASES)
+async def test_steam_move(repo, detector, snapshots, direction):
+    """Steam fires when enough books move one side the same way, else stays quiet."""
     await repo.insert_snapshots(snapshots)
 
-    detector = SteamMoveDetector(settings, repo)
-    signals = await detector.detect(event, t2)
+    signals = await detector.detect(snapshots[0].event_id, _T2)
 
+    if direction is None:
+        assert len(signals) == 0
+        return
     assert len(signals) == 1
     sig = signals[0]
     assert sig.signal_type == SignalType.STEAM_MOVE
     assert sig.details["books_moved"] == 3
-    assert sig.details["direction"] == "down"  # -3.5 → -4.0 is negative delta
-
-
-@pytest.mark.asyncio
-async def test_no_steam_below_threshold(settings, repo):
-    """Only 2 books moving should not trigger with min_books=3."""
-    event = "evt2"
-    t1 = "2025-01-15T12:00:00+00:00"
-    t2 = "2025-01-15T12:20:00+00:00"
-
-    snapshots = [
-        _snap(event, "draftkings", "spreads", "Lakers", -110, -3.5, t1),
-        _snap(event, "fanduel", "spreads", "Lakers", -110, -3.5, t1),
-        _snap(event, "betmgm", "spreads", "Lakers", -110, -3.5, t1),
-        _snap(event, "draftkings", "spreads", "Lakers", -110, -4.0, t2),
-        _snap(event, "fanduel", "spreads", "Lakers", -110, -4.0, t2),
-        _snap(event, "betmgm", "spreads", "Lakers", -110, -3.5, t2),  # didn't move
-    ]
-    await repo.insert_snapshots(snapshots)
-
-    detector = SteamMoveDetector(settings, repo)
-    signals = await detector.detect(event, t2)
-
-    assert len(signals) == 0
-
-
-@pytest.mark.asyncio
-async def test_steam_moneyline(settings, repo):
-    """Steam move on h2h market uses price delta."""
-    event = "evt3"
-    t1 = "2025-01-15T12:00:00+00:00"
-    t2 = "2025-01-15T12:20:00+00:00"
-
-    snapshots = [
-        _snap(event, "draftkings", "h2h", "Lakers", -150, None, t1),
-        _snap(event, "fanduel", "h2h", "Lakers", -150, None, t1),
-        _snap(event, "betmgm", "h2h", "Lakers", -150, None, t1),
-        _snap(event, "draftkings", "h2h", "Lakers", -170, None, t2),
-        _snap(event, "fanduel", "h2h", "Lakers", -175, None, t2),
-        _snap(event, "betmgm", "h2h", "Lakers", -165, None, t2),
-    ]
-    await repo.insert_snapshots(snapshots)
-
-    detector = SteamMoveDetector(settings, repo)
-    signals = await detector.detect(event, t2)
-
-    assert len(signals) == 1
-    assert signals[0].details["direction"] == "down"
+    assert sig.details["direction"] == direction
 
 
 @pytest.mark.asyncio
-async def test_steam_h2h_emits_only_shortening_side(settings, repo):
+async def test_steam_h2h_emits_only_shortening_side(repo, detector):
     """Regression (Cubs/Mets incident): when sharp money hits the dog, the dog
     shortens and the favorite lengthens. The detector must emit ONLY the
     shortening side (the side to bet), never the lengthening mirror — otherwise
@@ -120,8 +122,6 @@ async def test_steam_h2h_emits_only_shortening_side(settings, repo):
     filter before mirror-dedup runs.
     """
     event = "evt_cubs_mets"
-    t1 = "2025-01-15T12:00:00+00:00"
-    t2 = "2025-01-15T12:20:00+00:00"
 
     # Varied final prices so the side clears the detector's dispersion guard.
     mets_to = {"draftkings": 112, "fanduel": 108, "betmgm": 110}
@@ -129,15 +129,14 @@ async def test_steam_h2h_emits_only_shortening_side(settings, repo):
     snapshots = []
     for bm in ("draftkings", "fanduel", "betmgm"):
         # Mets (dog) shorten +130 -> ~+110 : negative delta -> "down" = bet side
-        snapshots.append(_snap(event, bm, "h2h", "Mets", 130, None, t1))
-        snapshots.append(_snap(event, bm, "h2h", "Mets", mets_to[bm], None, t2))
+        snapshots.append(_snap(event, bm, "h2h", "Mets", 130, None, _T1))
+        snapshots.append(_snap(event, bm, "h2h", "Mets", mets_to[bm], None, _T2))
         # Cubs (fav) lengthen -150 -> ~-130 : positive delta -> "up" = wrong side
-        snapshots.append(_snap(event, bm, "h2h", "Cubs", -150, None, t1))
-        snapshots.append(_snap(event, bm, "h2h", "Cubs", cubs_to[bm], None, t2))
+        snapshots.append(_snap(event, bm, "h2h", "Cubs", -150, None, _T1))
+        snapshots.append(_snap(event, bm, "h2h", "Cubs", cubs_to[bm], None, _T2))
     await repo.insert_snapshots(snapshots)
 
-    detector = SteamMoveDetector(settings, repo)
-    signals = await detector.detect(event, t2)
+    signals = await detector.detect(event, _T2)
 
     # Exactly one signal, and it must be the shortening (Mets) side.
     assert len(signals) == 1
@@ -146,30 +145,27 @@ async def test_steam_h2h_emits_only_shortening_side(settings, repo):
 
 
 @pytest.mark.asyncio
-async def test_steam_hold_in_details(settings, repo):
+async def test_steam_hold_in_details(repo, detector):
     """Steam move should include us_hold when both sides of the market are available."""
     event = "evt_hold1"
-    t1 = "2025-01-15T12:00:00+00:00"
-    t2 = "2025-01-15T12:20:00+00:00"
 
     snapshots = [
         # Time 1: 3 books at -3.5
-        _snap(event, "draftkings", "spreads", "Lakers", -110, -3.5, t1),
-        _snap(event, "fanduel", "spreads", "Lakers", -110, -3.5, t1),
-        _snap(event, "betmgm", "spreads", "Lakers", -110, -3.5, t1),
+        _snap(event, "draftkings", "spreads", "Lakers", -110, -3.5, _T1),
+        _snap(event, "fanduel", "spreads", "Lakers", -110, -3.5, _T1),
+        _snap(event, "betmgm", "spreads", "Lakers", -110, -3.5, _T1),
         # Time 2: 3 books move to -4.0
-        _snap(event, "draftkings", "spreads", "Lakers", -110, -4.0, t2),
-        _snap(event, "fanduel", "spreads", "Lakers", -110, -4.0, t2),
-        _snap(event, "betmgm", "spreads", "Lakers", -110, -4.0, t2),
+        _snap(event, "draftkings", "spreads", "Lakers", -110, -4.0, _T2),
+        _snap(event, "fanduel", "spreads", "Lakers", -110, -4.0, _T2),
+        _snap(event, "betmgm", "spreads", "Lakers", -110, -4.0, _T2),
         # Caesars didn't move — will be value book; add both sides for hold
-        _snap(event, "betrivers", "spreads", "Lakers", -105, -3.5, t1),
-        _snap(event, "betrivers", "spreads", "Lakers", -105, -3.5, t2),
-        _snap(event, "betrivers", "spreads", "Celtics", -105, 3.5, t2),
+        _snap(event, "betrivers", "spreads", "Lakers", -105, -3.5, _T1),
+        _snap(event, "betrivers", "spreads", "Lakers", -105, -3.5, _T2),
+        _snap(event, "betrivers", "spreads", "Celtics", -105, 3.5, _T2),
     ]
     await repo.insert_snapshots(snapshots)
 
-    detector = SteamMoveDetector(settings, repo)
-    signals = await detector.detect(event, t2)
+    signals = await detector.detect(event, _T2)
 
     assert len(signals) == 1
     sig = signals[0]
@@ -180,27 +176,51 @@ async def test_steam_hold_in_details(settings, repo):
 
 
 @pytest.mark.asyncio
-async def test_steam_hold_none_when_other_side_missing(settings, repo):
+async def test_steam_hold_none_when_other_side_missing(repo, detector):
     """Hold should be None when only one side of market is available."""
     event = "evt_hold2"
-    t1 = "2025-01-15T12:00:00+00:00"
-    t2 = "2025-01-15T12:20:00+00:00"
 
     snapshots = [
-        _snap(event, "draftkings", "spreads", "Lakers", -110, -3.5, t1),
-        _snap(event, "fanduel", "spreads", "Lakers", -110, -3.5, t1),
-        _snap(event, "betmgm", "spreads", "Lakers", -110, -3.5, t1),
-        _snap(event, "draftkings", "spreads", "Lakers", -110, -4.0, t2),
-        _snap(event, "fanduel", "spreads", "Lakers", -110, -4.0, t2),
-        _snap(event, "betmgm", "spreads", "Lakers", -110, -4.0, t2),
+        _snap(event, "draftkings", "spreads", "Lakers", -110, -3.5, _T1),
+        _snap(event, "fanduel", "spreads", "Lakers", -110, -3.5, _T1),
+        _snap(event, "betmgm", "spreads", "Lakers", -110, -3.5, _T1),
+        _snap(event, "draftkings", "spreads", "Lakers", -110, -4.0, _T2),
+        _snap(event, "fanduel", "spreads", "Lakers", -110, -4.0, _T2),
+        _snap(event, "betmgm", "spreads", "Lakers", -110, -4.0, _T2),
         # Caesars value book — but no other side
-        _snap(event, "betrivers", "spreads", "Lakers", -110, -3.5, t1),
-        _snap(event, "betrivers", "spreads", "Lakers", -110, -3.5, t2),
+        _snap(event, "betrivers", "spreads", "Lakers", -110, -3.5, _T1),
+        _snap(event, "betrivers", "spreads", "Lakers", -110, -3.5, _T2),
     ]
     await repo.insert_snapshots(snapshots)
 
-    detector = SteamMoveDetector(settings, repo)
-    signals = await detector.detect(event, t2)
+    signals = await detector.detect(event, _T2)
 
     assert len(signals) == 1
     assert signals[0].details["us_hold"] is None
+
+
+@pytest.mark.asyncio
+async def test_steam_value_books_from_window_endpoints(repo, detector):
+    """Stale-book prices come from the window read — no separate latest-snapshot query."""
+    event = "evt_endpoints"
+
+    snapshots = [
+        _snap(event, "draftkings", "spreads", "Lakers", -110, -3.5, _T1),
+        _snap(event, "fanduel", "spreads", "Lakers", -110, -3.5, _T1),
+        _snap(event, "betmgm", "spreads", "Lakers", -110, -3.5, _T1),
+        _snap(event, "betrivers", "spreads", "Lakers", -110, -3.5, _T1),
+        _snap(event, "draftkings", "spreads", "Lakers", -110, -4.0, _T2),
+        _snap(event, "fanduel", "spreads", "Lakers", -110, -4.0, _T2),
+        _snap(event, "betmgm", "spreads", "Lakers", -110, -4.0, _T2),
+        _snap(event, "betrivers", "spreads", "Lakers", -105, -3.5, _T2),
+    ]
+    await repo.insert_snapshots(snapshots)
+
+    with patch.object(repo, "get_latest_snapshots") as latest:
+        signals = await detector.detect(event, _T2)
+
+    latest.assert_not_called()
+    assert len(signals) == 1
+    assert signals[0].details["value_books"] == [
+        {"bookmaker": "betrivers", "price": -105, "point": -3.5, "deep_link": None},
+    ]